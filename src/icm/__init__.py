@@ -1,5 +1,6 @@
+from .core.composition import Composition, CompositionExplorer, compose_cog
 from .core.events import Event, EventBus
-from .core.iteration import IterationEngine, IterationResult
+from .core.iteration import ChainBatch, IterationEngine, IterationResult, stop_after, stop_when_unchanged
 from .core.models import Cog, CogGraph, CogScoring, Component, GraphNode, ScoreEntry, ScoreSet, Snapshot
 from .core.policy import PathPolicy
 from .core.render import AsciiRenderer
@@ -7,31 +8,40 @@ from .core.store import JsonSnapshotStore
 from .core.system import CogSystem
 from .interfaces.mcp_legacy import ICMMCPServer, ICMRuntimeRegistry, InteractionScope, MCPToolSpec, WorkspaceRuntime
 from .interfaces.mcp_server import build_mcp_server, run_mcp_stdio_server
+from .scoring.candidates import CandidateGenerator, ProjectionCandidateGenerator
 from .scoring.features import (
     AlphabetPolarBreadthTechnique,
+    BatchFeatureTechnique,
     CallableFeatureTechnique,
     FeatureTechnique,
     LetterDepthTechnique,
     LetterVolumeTechnique,
+    ProfiledFeatureTechnique,
+    TextProfile,
 )
-from .scoring.plugins import import_plugin_module, load_feature_techniques
+from .scoring.plugins import import_plugin_module, load_feature_techniques, supports_calculate_many
 from .scoring.presets import (
     StrategyPreset,
     WEIGHTED_STRATEGY_PRESETS,
     build_weighted_strategy_from_preset,
     list_weighted_strategy_presets,
 )
+from .scoring.scheduler import FeatureScheduler
 from .scoring.strategies import WeightedFeatureStrategy
 
 __all__ = [
     "AsciiRenderer",
+    "ChainBatch",
     "Cog",
     "CogGraph",
     "CogScoring",
     "CogSystem",
     "Component",
+    "Composition",
+    "CompositionExplorer",
     "Event",
     "EventBus",
+    "FeatureScheduler",
     "FeatureTechnique",
     "GraphNode",
     "ICMMCPServer",
@@ -42,21 +52,30 @@ __all__ = [
     "IterationResult",
     "JsonSnapshotStore",
     "AlphabetPolarBreadthTechnique",
+    "BatchFeatureTechnique",
     "CallableFeatureTechnique",
+    "CandidateGenerator",
     "LetterDepthTechnique",
     "LetterVolumeTechnique",
     "load_feature_techniques",
+    "supports_calculate_many",
     "MCPToolSpec",
     "StrategyPreset",
+    "TextProfile",
     "WEIGHTED_STRATEGY_PRESETS",
     "build_weighted_strategy_from_preset",
     "list_weighted_strategy_presets",
     "PathPolicy",
+    "ProfiledFeatureTechnique",
+    "ProjectionCandidateGenerator",
     "ScoreEntry",
     "ScoreSet",
     "Snapshot",
     "WorkspaceRuntime",
     "WeightedFeatureStrategy",
     "build_mcp_server",
+    "compose_cog",
     "run_mcp_stdio_server",
+    "stop_after",
+    "stop_when_unchanged",
 ]
@@ -1,6 +1,9 @@
+from .composition import Composition, CompositionExplorer, compose_cog
 from .events import Event, EventBus
-from .index import Neighbor, NeighborIndex
-from .iteration import IterationEngine, IterationResult
+from .feature_cache import FeatureCache
+from .feature_table import FeatureTable
+from .index import CogIdTable, Neighbor, NeighborIndex, NeighborRow, TraversalState
+from .iteration import ChainBatch, IterationEngine, IterationResult, stop_after, stop_when_unchanged
 from .models import (
     Cog,
     CogGraph,
@@ -19,13 +22,19 @@ from .system import CogSystem
 
 __all__ = [
     "AsciiRenderer",
+    "ChainBatch",
     "Cog",
     "CogGraph",
+    "CogIdTable",
     "CogScoring",
     "CogSystem",
     "Component",
+    "Composition",
+    "CompositionExplorer",
     "Event",
     "EventBus",
+    "FeatureCache",
+    "FeatureTable",
     "GraphNode",
     "IterationEngine",
     "IterationResult",
@@ -33,8 +42,13 @@ __all__ = [
     "LineageOperation",
     "Neighbor",
     "NeighborIndex",
+    "NeighborRow",
     "PathPolicy",
     "ScoreEntry",
     "ScoreSet",
     "Snapshot",
+    "TraversalState",
+    "compose_cog",
+    "stop_after",
+    "stop_when_unchanged",
 ]
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .events import Event
+from .feature_table import FeatureTable
+from .models import Cog, CogScoring, LineageOperation
+from .system import CogSystem
+from ..scoring.parallel import score_pairs
+
+
+def compose_cog(new_cog_id: str, sources: list[Cog], theme: str | None = None) -> Cog:
+    """Build, without registering, the cog composed from ``sources`` in the given order.
+
+    Themes are joined with ``" + "`` and contents with spaces (falling back to the
+    themes), component ids are merged in order, ``directional_bias`` is averaged and
+    feature techniques are inherited from the first source.
+    """
+    unique_themes: list[str] = []
+    for cog in sources:
+        if cog.theme not in unique_themes:
+            unique_themes.append(cog.theme)
+    content = " ".join([cog.content for cog in sources if cog.content.strip()])
+    if not content:
+        content = " ".join(unique_themes)
+
+    component_ids: list[str] = []
+    for cog in sources:
+        for component_id in cog.component_ids:
+            if component_id not in component_ids:
+                component_ids.append(component_id)
+
+    directional_bias_values = [float(cog.features.get("directional_bias", 0.0)) for cog in sources]
+    directional_bias = sum(directional_bias_values) / max(len(directional_bias_values), 1)
+    return Cog(
+        id=new_cog_id,
+        theme=" + ".join(unique_themes) if theme is None else theme,
+        breadth=0.0,
+        depth=0.0,
+        volume=0.0,
+        content=content,
+        component_ids=component_ids,
+        features={"directional_bias": directional_bias},
+        scoring=CogScoring(feature_techniques=deepcopy(sources[0].scoring.feature_techniques) if sources else {}),
+    )
+
+
+@dataclass(frozen=True)
+class Composition:
+    """A virtual product of ``source_ids`` (sorted), scored against the population.
+
+    ``cog`` carries the composed content and derived features but is not registered;
+    its id is the sources joined by ``*`` with a leading ``*`` (more if that id is taken).
+    ``scores`` maps every population cog to the composed cog's score towards it;
+    ``score`` is the mean of those towards its own sources.
+    """
+
+    source_ids: tuple[str, ...]
+    cog: Cog
+    score: float
+    scores: dict[str, float] = field(default_factory=dict, compare=False, repr=False)
+
+
+class CompositionExplorer:
+    """Evaluate candidate compositions without inserting cogs.
+
+    Products are memoized by their sorted source-id set, so ``A x B`` computed while
+    exploring is reused by ``A x B x C`` and by any later call. Composed cogs are
+    built in sorted source order, which is what makes the set a sound key. The memo is
+    dropped whenever cogs change or a snapshot is loaded.
+
+    With ``min_score`` set, a product is extended by a cog only when the product's
+    score towards that cog reaches it (the projected score, read from the already
+    computed row), and a product whose own score falls below it is neither kept nor
+    extended.
+    """
+
+    def __init__(
+        self,
+        system: CogSystem,
+        strategy_id: str,
+        min_score: float | None = None,
+        cog_ids: list[str] | None = None,
+    ) -> None:
+        if strategy_id not in system.strategies:
+            raise ValueError(f"Unknown strategy: {strategy_id}")
+        self.system = system
+        self.strategy_id = strategy_id
+        self.min_score = min_score
+        self.population_ids = cog_ids
+        self.evaluations = 0
+        self._memo: dict[tuple[str, ...], Composition] = {}
+        self._rows: dict[str, dict[str, float]] = {}
+        self._cogs = system.cogs
+        self._listening = True
+        system.event_bus.subscribe("cog.updated", self._on_cogs_updated, weak=True)
+        system.event_bus.subscribe("cogs.updated", self._on_cogs_updated, weak=True)
+
+    def clear(self) -> None:
+        self._memo.clear()
+        self._rows.clear()
+        self._cogs = self.system.cogs
+
+    def close(self) -> None:
+        """Stop listening to cog events and drop the memo.
+
+        Without events the memo could go stale, so afterwards it only lives for the
+        duration of one call.
+        """
+        self.system.event_bus.unsubscribe("cog.updated", self._on_cogs_updated)
+        self.system.event_bus.unsubscribe("cogs.updated", self._on_cogs_updated)
+        self._listening = False
+        self.clear()
+
+    def memo_size(self) -> int:
+        return len(self._memo)
+
+    def evaluate(self, cog_ids: Iterable[str]) -> Composition:
+        return self.evaluate_many([cog_ids])[0]
+
+    def evaluate_many(self, groups: Iterable[Iterable[str]]) -> list[Composition]:
+        """Return one composition per group of at least two cog ids, computing misses in one batch."""
+        self._check_population()
+        keys = [self._key(group) for group in groups]
+        missing = list(dict.fromkeys(key for key in keys if key not in self._memo))
+        if missing:
+            cogs = self.system.cogs
+            composed = self.system.preview_features(
+                [compose_cog(self._virtual_id(key), [cogs[cog_id] for cog_id in key]) for key in missing]
+            )
+            rows = self._score_rows(composed, None)
+            for key, cog, row in zip(missing, composed, rows):
+                score = sum(row.get(cog_id, 0.0) for cog_id in key) / len(key)
+                self._memo[key] = Composition(source_ids=key, cog=cog, score=score, scores=row)
+            self.evaluations += len(missing)
+        return [self._memo[key] for key in keys]
+
+    def explore_chain(self, chain: list[str]) -> list[Composition]:
+        """Evaluate the running products ``A x B``, ``A x B x C``, ... along ``chain``.
+
+        Stops at the first product whose projected or actual score is below
+        ``min_score``; returns the products evaluated before that point.
+        """
+        if len(chain) < 2:
+            return []
+        self._check_population()
+        results: list[Composition] = []
+        projected = self._cog_rows([chain[0]])[0].get(chain[1], 0.0)
+        for stop in range(2, len(chain) + 1):
+            if not self._passes(projected):
+                break
+            composition = self.evaluate(chain[:stop])
+            if not self._passes(composition.score):
+                break
+            results.append(composition)
+            if stop < len(chain):
+                projected = composition.scores.get(chain[stop], 0.0)
+        return results
+
+    def explore(
+        self,
+        cog_ids: list[str] | None = None,
+        max_factors: int = 3,
+        top_k: int | None = 10,
+    ) -> list[Composition]:
+        """Search products of 2..``max_factors`` distinct cogs drawn from ``cog_ids``.
+
+        Works level by level: every surviving product is extended by each larger id
+        whose projected score passes, and each level is evaluated in one batch. Returns
+        the surviving products of every size, best score first.
+        """
+        if max_factors < 2:
+            raise ValueError("max_factors must be at least 2.")
+        self._check_population()
+        candidates = sorted(dict.fromkeys(self._population() if cog_ids is None else cog_ids))
+        unknown = [cog_id for cog_id in candidates if cog_id not in self.system.cogs]
+        if unknown:
+            raise ValueError(f"Unknown cog ids for composition: {unknown}")
+
+        rows = self._cog_rows(candidates)
+        level: list[tuple[str, ...]] = []
+        for pos, (cog_id, row) in enumerate(zip(candidates, rows)):
+            level.extend(
+                (cog_id, other) for other in candidates[pos + 1 :] if self._passes(row.get(other, 0.0))
+            )
+        survivors: list[Composition] = []
+        size = 2
+        while level:
+            kept = [item for item in self.evaluate_many(level) if self._passes(item.score)]
+            survivors.extend(kept)
+            if size >= max_factors:
+                break
+            level = [
+                item.source_ids + (other,)
+                for item in kept
+                for other in candidates
+                if other > item.source_ids[-1] and self._passes(item.scores.get(other, 0.0))
+            ]
+            size += 1
+        survivors.sort(key=lambda item: (-item.score, item.source_ids))
+        return survivors if top_k is None else survivors[:top_k]
+
+    def materialize(
+        self,
+        compositions: list[Composition],
+        new_cog_ids: list[str] | None = None,
+    ) -> list[Cog]:
+        """Insert the given compositions as real cogs inside a single ``CogSystem.batch``.
+
+        Each new cog defaults to its sources joined by ``*`` and gets a ``compose``
+        lineage record. Affected score sets are rescored once.
+        """
+        if new_cog_ids is None:
+            ids = ["*".join(item.source_ids) for item in compositions]
+        else:
+            ids = list(new_cog_ids)
+        if len(ids) != len(compositions):
+            raise ValueError("new_cog_ids must have one id per composition.")
+        taken = [cog_id for cog_id in ids if cog_id in self.system.cogs]
+        if taken or len(set(ids)) != len(ids):
+            raise ValueError(f"New cog ids must be unique and unused: {taken or ids}")
+
+        cogs = self.system.cogs
+        created: list[Cog] = []
+        with self.system.batch():
+            for composition, new_cog_id in zip(compositions, ids):
+                cog = compose_cog(new_cog_id, [cogs[cog_id] for cog_id in composition.source_ids])
+                self.system.add_cog(cog)
+                self.system.lineage.append(
+                    LineageOperation(
+                        op_type="compose",
+                        inputs=list(composition.source_ids),
+                        outputs=[new_cog_id],
+                        metadata={"strategy_id": self.strategy_id, "score": str(composition.score)},
+                    )
+                )
+                created.append(cog)
+        return created
+
+    def _passes(self, score: float) -> bool:
+        return self.min_score is None or score >= self.min_score
+
+    def _key(self, cog_ids: Iterable[str]) -> tuple[str, ...]:
+        key = tuple(sorted(set(cog_ids)))
+        if len(key) < 2:
+            raise ValueError("A composition needs at least two distinct cog ids.")
+        missing = [cog_id for cog_id in key if cog_id not in self.system.cogs]
+        if missing:
+            raise ValueError(f"Unknown cog ids for composition: {missing}")
+        return key
+
+    def _virtual_id(self, key: tuple[str, ...]) -> str:
+        """Return an id for the unregistered product of ``key`` that no cog uses.
+
+        Scoring skips pairs whose ids match, so a product sharing an id with a
+        registered cog (e.g. a materialized ``A*B``) would lose its score towards it.
+        """
+        virtual_id = "*" + "*".join(key)
+        while virtual_id in self.system.cogs:
+            virtual_id = "*" + virtual_id
+        return virtual_id
+
+    def _population(self) -> list[str]:
+        return list(self.system.cogs) if self.population_ids is None else self.population_ids
+
+    def _cog_rows(self, cog_ids: list[str]) -> list[dict[str, float]]:
+        missing = [cog_id for cog_id in dict.fromkeys(cog_ids) if cog_id not in self._rows]
+        if missing:
+            sources = [self.system.cogs[cog_id] for cog_id in missing]
+            self._rows.update(zip(missing, self._score_rows(sources, self.system.feature_table)))
+        return [self._rows[cog_id] for cog_id in cog_ids]
+
+    def _score_rows(self, sources: list[Cog], feature_table: FeatureTable | None) -> list[dict[str, float]]:
+        cogs = self.system.cogs
+        targets = [cogs[cog_id] for cog_id in self._population()]
+        rows: dict[str, dict[str, float]] = {cog.id: {} for cog in sources}
+        strategy = self.system.strategies[self.strategy_id]
+        for entry in score_pairs(strategy, sources, targets, feature_table, include_vectors=False):
+            rows[entry.from_cog_id][entry.to_cog_id] = entry.score
+        return [rows[cog.id] for cog in sources]
+
+    def _check_population(self) -> None:
+        if not self._listening or self._cogs is not self.system.cogs:
+            self.clear()
+
+    def _on_cogs_updated(self, event: Event) -> None:
+        self.clear()
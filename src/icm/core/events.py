@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Callable, DefaultDict
@@ -16,11 +17,37 @@ EventHandler = Callable[[Event], None]
 
 class EventBus:
     def __init__(self) -> None:
-        self._handlers: DefaultDict[str, list[EventHandler]] = defaultdict(list)
+        self._handlers: DefaultDict[str, list[EventHandler | weakref.WeakMethod]] = defaultdict(list)
 
-    def subscribe(self, topic: str, handler: EventHandler) -> None:
-        self._handlers[topic].append(handler)
+    def subscribe(self, topic: str, handler: EventHandler, weak: bool = False) -> None:
+        """Register ``handler`` for ``topic``.
+
+        With ``weak=True`` (bound methods only) the bus does not keep the handler's owner
+        alive; once the owner is collected the subscription is dropped (on the next
+        ``publish`` or ``subscribe`` for the topic).
+        """
+        handlers = [item for item in self._handlers[topic] if _resolve(item) is not None]
+        handlers.append(weakref.WeakMethod(handler) if weak else handler)  # type: ignore[arg-type]
+        self._handlers[topic] = handlers
+
+    def unsubscribe(self, topic: str, handler: EventHandler) -> None:
+        """Remove every registration of ``handler`` for ``topic``; unknown handlers are ignored."""
+        handlers = self._handlers.get(topic)
+        if handlers:
+            self._handlers[topic] = [item for item in handlers if _resolve(item) != handler]
 
     def publish(self, event: Event) -> None:
-        for handler in self._handlers.get(event.topic, []):
+        handlers = self._handlers.get(event.topic, [])
+        dead = False
+        for item in handlers:
+            handler = _resolve(item)
+            if handler is None:
+                dead = True
+                continue
             handler(event)
+        if dead:
+            self._handlers[event.topic] = [item for item in self._handlers[event.topic] if _resolve(item) is not None]
+
+
+def _resolve(item: EventHandler | weakref.WeakMethod) -> EventHandler | None:
+    return item() if isinstance(item, weakref.WeakMethod) else item
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def text_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class FeatureCache:
+    """Bounded LRU of technique values keyed by ``(technique id, text digest)``.
+
+    Only techniques whose values depend on nothing but the cog text (the
+    ``calculate_with_profile`` path) are cached. ``hits``, ``misses`` and ``skipped``
+    (cogs whose feature inputs were unchanged and needed no lookup at all) accumulate
+    until ``reset_stats``.
+    """
+
+    def __init__(self, max_entries: int = 65_536) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self._values: OrderedDict[tuple[str, bytes], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, technique_id: str, digest: bytes) -> float | None:
+        key = (technique_id, digest)
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._values.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, technique_id: str, digest: bytes, value: float) -> None:
+        if self.max_entries == 0:
+            return
+        key = (technique_id, digest)
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+
+    def invalidate(self, technique_id: str) -> None:
+        with self._lock:
+            for key in [key for key in self._values if key[0] == technique_id]:
+                del self._values[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "entries": len(self._values),
+            "max_entries": self.max_entries,
+        }
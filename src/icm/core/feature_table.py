@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from array import array
+
+
+class FeatureTable:
+    """Columnar store of normalized cog feature values.
+
+    Every ``namespace.feature`` pair owns one contiguous ``array("d")`` column plus a
+    presence mask, and every namespace owns a presence mask of its own. Rows are
+    assigned once per cog id and updated in place.
+    """
+
+    def __init__(self) -> None:
+        self.row_of: dict[str, int] = {}
+        self.cog_ids: list[str] = []
+        self.columns: dict[tuple[str, str], array] = {}
+        self.present: dict[tuple[str, str], bytearray] = {}
+        self.namespaces: dict[str, bytearray] = {}
+        self.schema_version = 1
+
+    def __len__(self) -> int:
+        return len(self.cog_ids)
+
+    def __contains__(self, cog_id: object) -> bool:
+        return cog_id in self.row_of
+
+    def keys(self) -> list[str]:
+        return [f"{namespace}.{feature_name}" for namespace, feature_name in self.columns]
+
+    def upsert(self, cog_id: str, values: dict[str, dict[str, float]]) -> int:
+        row = self.row_of.get(cog_id)
+        if row is None:
+            row = len(self.cog_ids)
+            self.row_of[cog_id] = row
+            self.cog_ids.append(cog_id)
+            for column in self.columns.values():
+                column.append(0.0)
+            for mask in self.present.values():
+                mask.append(0)
+            for mask in self.namespaces.values():
+                mask.append(0)
+        else:
+            for key, mask in self.present.items():
+                if mask[row]:
+                    mask[row] = 0
+                    self.columns[key][row] = 0.0
+            for mask in self.namespaces.values():
+                mask[row] = 0
+
+        for namespace, feature_values in values.items():
+            self._namespace_mask(namespace)[row] = 1
+            for feature_name, value in feature_values.items():
+                key = (namespace, feature_name)
+                if key not in self.columns:
+                    self.columns[key] = array("d", bytes(8 * len(self.cog_ids)))
+                    self.present[key] = bytearray(len(self.cog_ids))
+                    self.schema_version += 1
+                self.columns[key][row] = float(value)
+                self.present[key][row] = 1
+        return row
+
+    def values(self, cog_id: str) -> dict[str, dict[str, float]]:
+        row = self.row_of[cog_id]
+        result: dict[str, dict[str, float]] = {
+            namespace: {} for namespace, mask in self.namespaces.items() if mask[row]
+        }
+        for (namespace, feature_name), mask in self.present.items():
+            if mask[row]:
+                result[namespace][feature_name] = self.columns[(namespace, feature_name)][row]
+        return result
+
+    def column(self, namespace: str, feature_name: str) -> array:
+        return self.columns[(namespace, feature_name)]
+
+    def clear(self) -> None:
+        self.row_of.clear()
+        self.cog_ids.clear()
+        self.columns.clear()
+        self.present.clear()
+        self.namespaces.clear()
+        self.schema_version += 1
+
+    def _namespace_mask(self, namespace: str) -> bytearray:
+        mask = self.namespaces.get(namespace)
+        if mask is None:
+            mask = bytearray(len(self.cog_ids))
+            self.namespaces[namespace] = mask
+            self.schema_version += 1
+        return mask
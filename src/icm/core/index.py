@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Iterable, Iterator, overload
 
 from .models import ScoreEntry, ScoreSet
 
+# (old, new) entries for one ordered pair; ``None`` marks an added or removed pair.
+EntryChange = tuple["ScoreEntry | None", "ScoreEntry | None"]
+
+# (score, variance, strategy id) of one ordered or symmetrized pair.
+PairValue = tuple[float, float, str]
+
 
 @dataclass(frozen=True)
 class Neighbor:
@@ -13,11 +23,106 @@ class Neighbor:
     strategy_id: str
 
 
+class CogIdTable:
+    """Append-only interning of cog ids to dense integers shared by neighbor indexes."""
+
+    def __init__(self, cog_ids: Iterable[str] = ()) -> None:
+        self.ids: list[str] = []
+        self.positions: dict[str, int] = {}
+        for cog_id in cog_ids:
+            self.intern(cog_id)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def intern(self, cog_id: str) -> int:
+        pos = self.positions.get(cog_id)
+        if pos is None:
+            pos = len(self.ids)
+            self.positions[cog_id] = pos
+            self.ids.append(cog_id)
+        return pos
+
+    def get(self, cog_id: str) -> int | None:
+        return self.positions.get(cog_id)
+
+
+class NeighborRow(Sequence):
+    """Read-only view of one ranked index row; ``Neighbor`` objects are built on access."""
+
+    __slots__ = ("_index", "_start", "_stop")
+
+    def __init__(self, index: "NeighborIndex", start: int, stop: int) -> None:
+        self._index = index
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, item: int) -> Neighbor: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "NeighborRow": ...
+
+    def __getitem__(self, item: int | slice) -> "Neighbor | NeighborRow":
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                raise ValueError("NeighborRow slices do not support a step.")
+            return NeighborRow(self._index, self._start + start, self._start + max(start, stop))
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("NeighborRow index out of range")
+        return self._index._neighbor_at(self._start + item)
+
+    def __iter__(self) -> Iterator[Neighbor]:
+        neighbor_at = self._index._neighbor_at
+        for pos in range(self._start, self._stop):
+            yield neighbor_at(pos)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (NeighborRow, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NeighborRow({list(self)!r})"
+
+    def to_cog_ids(self) -> Iterator[str]:
+        ids = self._index.cog_ids.ids
+        targets = self._index.targets
+        for pos in range(self._start, self._stop):
+            yield ids[targets[pos]]
+
+
 class NeighborIndex:
-    def __init__(self, score_set: ScoreSet, direction_mode: str = "directed") -> None:
+    """Ranked neighbor rows of a score set in compressed sparse row (CSR) form.
+
+    Row ``r`` (the interned id of a source cog) spans ``offsets[r]:offsets[r + 1]`` of the
+    flat ``targets`` (int32 interned ids), ``scores`` and ``variances`` (float64) arrays,
+    sorted by ``(-score, variance, to_cog_id)``. Strategy ids are stored as codes into
+    ``strategy_ids``. Rows past the end of ``offsets`` are empty.
+    """
+
+    def __init__(
+        self,
+        score_set: ScoreSet,
+        direction_mode: str = "directed",
+        cog_ids: CogIdTable | None = None,
+    ) -> None:
         self.score_set_id = score_set.id
         self.direction_mode = direction_mode
-        self.by_from: dict[str, list[Neighbor]] = {}
+        self.cog_ids = cog_ids if cog_ids is not None else CogIdTable()
+        self.offsets = array("q", [0])
+        self.targets = array("i")
+        self.scores = array("d")
+        self.variances = array("d")
+        self.strategy_codes = array("i")
+        self.strategy_ids: list[str] = []
+        self._strategy_pos: dict[str, int] = {}
         if direction_mode == "directed":
             self._build_directed(score_set)
         elif direction_mode == "symmetrized":
@@ -26,25 +131,17 @@ class NeighborIndex:
             raise ValueError(f"Unsupported direction mode: {direction_mode}")
 
     def _build_directed(self, score_set: ScoreSet) -> None:
-        by_from: dict[str, list[Neighbor]] = {}
+        intern = self.cog_ids.intern
+        rows: dict[int, list[tuple[int, float, float, str]]] = {}
         for entry in score_set.entries.values():
-            by_from.setdefault(entry.from_cog_id, []).append(
-                Neighbor(
-                    to_cog_id=entry.to_cog_id,
-                    score=entry.score,
-                    variance=entry.variance,
-                    strategy_id=entry.strategy_id,
-                )
+            rows.setdefault(intern(entry.from_cog_id), []).append(
+                (intern(entry.to_cog_id), entry.score, entry.variance, entry.strategy_id)
             )
-        self.by_from = by_from
-        self._sort_all()
+        self._fill(rows)
 
     def _build_symmetrized(self, score_set: ScoreSet) -> None:
-        pair_scores: dict[tuple[str, str], tuple[float, float, str]] = {}
-        ids: set[str] = set()
+        pair_scores: dict[tuple[str, str], PairValue] = {}
         for entry in score_set.entries.values():
-            ids.add(entry.from_cog_id)
-            ids.add(entry.to_cog_id)
             pair = tuple(sorted((entry.from_cog_id, entry.to_cog_id)))
             current = pair_scores.get(pair)
             if current is None:
@@ -54,24 +151,217 @@ class NeighborIndex:
                 avg_variance = (current[1] + entry.variance) / 2.0
                 pair_scores[pair] = (avg_score, avg_variance, entry.strategy_id)
 
-        by_from: dict[str, list[Neighbor]] = {cog_id: [] for cog_id in ids}
+        intern = self.cog_ids.intern
+        rows: dict[int, list[tuple[int, float, float, str]]] = {}
         for (left, right), (score, variance, strategy_id) in pair_scores.items():
-            by_from.setdefault(left, []).append(
-                Neighbor(to_cog_id=right, score=score, variance=variance, strategy_id=strategy_id)
-            )
-            by_from.setdefault(right, []).append(
-                Neighbor(to_cog_id=left, score=score, variance=variance, strategy_id=strategy_id)
+            left_pos, right_pos = intern(left), intern(right)
+            rows.setdefault(left_pos, []).append((right_pos, score, variance, strategy_id))
+            rows.setdefault(right_pos, []).append((left_pos, score, variance, strategy_id))
+        self._fill(rows)
+
+    def _fill(self, rows: dict[int, list[tuple[int, float, float, str]]]) -> None:
+        ids = self.cog_ids.ids
+        row_count = len(self.cog_ids)
+        offsets = array("q", [0]) * (row_count + 1)
+        for row in range(row_count):
+            items = rows.get(row)
+            if items:
+                items.sort(key=lambda item: (-item[1], item[2], ids[item[0]]))
+                self._append(items)
+            offsets[row + 1] = len(self.targets)
+        self.offsets = offsets
+
+    def _append(self, items: list[tuple[int, float, float, str]]) -> None:
+        self.targets.extend(item[0] for item in items)
+        self.scores.extend(item[1] for item in items)
+        self.variances.extend(item[2] for item in items)
+        self.strategy_codes.extend(self._strategy_code(item[3]) for item in items)
+
+    def _strategy_code(self, strategy_id: str) -> int:
+        code = self._strategy_pos.get(strategy_id)
+        if code is None:
+            code = len(self.strategy_ids)
+            self._strategy_pos[strategy_id] = code
+            self.strategy_ids.append(strategy_id)
+        return code
+
+    def _neighbor_at(self, pos: int) -> Neighbor:
+        return Neighbor(
+            to_cog_id=self.cog_ids.ids[self.targets[pos]],
+            score=self.scores[pos],
+            variance=self.variances[pos],
+            strategy_id=self.strategy_ids[self.strategy_codes[pos]],
+        )
+
+    def _rank_at(self, pos: int) -> tuple[float, float, str]:
+        return (-self.scores[pos], self.variances[pos], self.cog_ids.ids[self.targets[pos]])
+
+    def row_bounds(self, from_cog_id: str) -> tuple[int, int]:
+        """Return the ``[start, stop)`` span of a row in the flat arrays (empty if unknown)."""
+        row = self.cog_ids.get(from_cog_id)
+        if row is None or row + 1 >= len(self.offsets):
+            return 0, 0
+        return self.offsets[row], self.offsets[row + 1]
+
+    def apply_changes(self, score_set: ScoreSet, changes: Iterable[EntryChange]) -> None:
+        """Patch the index after ``score_set`` entries changed, as if it had been rebuilt.
+
+        ``score_set`` must already hold the new entries. A row whose length is unchanged
+        moves each changed neighbor in place (bisect plus one slice shift); rows that grow,
+        shrink or change heavily are re-sorted and the flat arrays are re-spliced once. In
+        symmetrized mode each touched pair is re-averaged from both directions.
+        """
+        if self.direction_mode == "directed":
+            row_changes: dict[str, dict[str, tuple[PairValue | None, PairValue | None]]] = {}
+            for old, new in changes:
+                entry = new if new is not None else old
+                if entry is None:
+                    continue
+                pending = row_changes.setdefault(entry.from_cog_id, {})
+                before = pending[entry.to_cog_id][0] if entry.to_cog_id in pending else _entry_value(old)
+                pending[entry.to_cog_id] = (before, _entry_value(new))
+        else:
+            old_entries: dict[tuple[str, str], ScoreEntry | None] = {}
+            for old, new in changes:
+                entry = new if new is not None else old
+                if entry is None:
+                    continue
+                old_entries.setdefault((entry.from_cog_id, entry.to_cog_id), old)
+            row_changes = {}
+            for from_cog_id, to_cog_id in old_entries:
+                left, right = sorted((from_cog_id, to_cog_id))
+                if left in row_changes and right in row_changes[left]:
+                    continue
+
+                def lookup(src: str, dst: str) -> ScoreEntry | None:
+                    if (src, dst) in old_entries:
+                        return old_entries[(src, dst)]
+                    return score_set.get(src, dst)
+
+                before = _pair_value(lookup(left, right), lookup(right, left))
+                after = _pair_value(score_set.get(left, right), score_set.get(right, left))
+                row_changes.setdefault(left, {})[right] = (before, after)
+                row_changes.setdefault(right, {})[left] = (before, after)
+
+        intern = self.cog_ids.intern
+        resized: dict[int, list[tuple[int, float, float, str]]] = {}
+        for from_cog_id, pending in row_changes.items():
+            row = intern(from_cog_id)
+            patched = self._patch_row(row, {intern(to_cog_id): change for to_cog_id, change in pending.items()})
+            if patched is not None:
+                resized[row] = patched
+        if resized:
+            self._splice(resized)
+
+    def _patch_row(
+        self,
+        row: int,
+        pending: dict[int, tuple[PairValue | None, PairValue | None]],
+    ) -> list[tuple[int, float, float, str]] | None:
+        """Patch one row in place, or return its new items when the row must be re-spliced."""
+        start, stop = (self.offsets[row], self.offsets[row + 1]) if row + 1 < len(self.offsets) else (0, 0)
+        in_place = 4 * len(pending) < stop - start and all(
+            before is not None and after is not None for before, after in pending.values()
+        )
+        if not in_place:
+            ids = self.cog_ids.ids
+            items = [
+                (self.targets[pos], self.scores[pos], self.variances[pos], self.strategy_ids[self.strategy_codes[pos]])
+                for pos in range(start, stop)
+                if self.targets[pos] not in pending
+            ]
+            items.extend((target, *after) for target, (_, after) in pending.items() if after is not None)
+            items.sort(key=lambda item: (-item[1], item[2], ids[item[0]]))
+            if len(items) != stop - start:
+                return items
+            for offset, item in enumerate(items):
+                self._write(start + offset, item)
+            return None
+
+        ids = self.cog_ids.ids
+        for target, (_, after) in pending.items():
+            old_pos = self.targets.index(target, start, stop)
+            rank = (-after[0], after[1], ids[target])  # type: ignore[index]
+            rank_at = self._rank_at
+            new_pos = start + bisect_left(
+                range(start, stop - 1),
+                rank,
+                key=lambda pos: rank_at(pos if pos < old_pos else pos + 1),
             )
+            for values in (self.targets, self.scores, self.variances, self.strategy_codes):
+                if new_pos < old_pos:
+                    values[new_pos + 1 : old_pos + 1] = values[new_pos:old_pos]
+                elif new_pos > old_pos:
+                    values[old_pos:new_pos] = values[old_pos + 1 : new_pos + 1]
+            self._write(new_pos, (target, *after))  # type: ignore[misc]
+        return None
+
+    def _write(self, pos: int, item: tuple[int, float, float, str]) -> None:
+        self.targets[pos] = item[0]
+        self.scores[pos] = item[1]
+        self.variances[pos] = item[2]
+        self.strategy_codes[pos] = self._strategy_code(item[3])
 
-        self.by_from = by_from
-        self._sort_all()
+    def _splice(self, resized: dict[int, list[tuple[int, float, float, str]]]) -> None:
+        """Rebuild the flat arrays once, replacing the rows in ``resized``."""
+        old_targets, old_scores, old_variances, old_codes = (
+            self.targets,
+            self.scores,
+            self.variances,
+            self.strategy_codes,
+        )
+        old_offsets = self.offsets
+        self.targets, self.scores, self.variances, self.strategy_codes = (
+            array("i"),
+            array("d"),
+            array("d"),
+            array("i"),
+        )
+        row_count = len(self.cog_ids)
+        offsets = array("q", [0]) * (row_count + 1)
+        for row in range(row_count):
+            items = resized.get(row)
+            if items is not None:
+                self._append(items)
+            elif row + 1 < len(old_offsets):
+                start, stop = old_offsets[row], old_offsets[row + 1]
+                self.targets.extend(old_targets[start:stop])
+                self.scores.extend(old_scores[start:stop])
+                self.variances.extend(old_variances[start:stop])
+                self.strategy_codes.extend(old_codes[start:stop])
+            offsets[row + 1] = len(self.targets)
+        self.offsets = offsets
 
-    def _sort_all(self) -> None:
-        for from_cog_id in self.by_from:
-            self.by_from[from_cog_id].sort(key=lambda item: (-item.score, item.variance, item.to_cog_id))
+    def neighbors(self, from_cog_id: str) -> NeighborRow:
+        start, stop = self.row_bounds(from_cog_id)
+        return NeighborRow(self, start, stop)
 
-    def neighbors(self, from_cog_id: str) -> list[Neighbor]:
-        return list(self.by_from.get(from_cog_id, []))
+    def row_scores(self, from_cog_id: str) -> dict[str, float]:
+        """Map each neighbor of ``from_cog_id`` to its score for O(1) pair lookups."""
+        ids = self.cog_ids.ids
+        start, stop = self.row_bounds(from_cog_id)
+        return {ids[target]: score for target, score in zip(self.targets[start:stop], self.scores[start:stop])}
+
+    def _candidates(
+        self,
+        from_cog_id: str,
+        seen: set[str],
+        min_score: float | None,
+        allowed: set[str] | None,
+    ) -> Iterator[int]:
+        ids = self.cog_ids.ids
+        targets = self.targets
+        scores = self.scores
+        start, stop = self.row_bounds(from_cog_id)
+        for pos in range(start, stop):
+            to_cog_id = ids[targets[pos]]
+            if to_cog_id in seen:
+                continue
+            if allowed is not None and to_cog_id not in allowed:
+                continue
+            if min_score is not None and scores[pos] < min_score:
+                continue
+            yield pos
 
     def top_unseen(
         self,
@@ -80,14 +370,8 @@ class NeighborIndex:
         min_score: float | None = None,
         allowed: set[str] | None = None,
     ) -> Neighbor | None:
-        for neighbor in self.by_from.get(from_cog_id, []):
-            if neighbor.to_cog_id in seen:
-                continue
-            if allowed is not None and neighbor.to_cog_id not in allowed:
-                continue
-            if min_score is not None and neighbor.score < min_score:
-                continue
-            return neighbor
+        for pos in self._candidates(from_cog_id, seen, min_score, allowed):
+            return self._neighbor_at(pos)
         return None
 
     def range_group(
@@ -98,24 +382,37 @@ class NeighborIndex:
         min_score: float | None = None,
         allowed: set[str] | None = None,
     ) -> list[Neighbor]:
-        items = self.by_from.get(from_cog_id, [])
+        scores = self.scores
         baseline: float | None = None
         grouped: list[Neighbor] = []
-        for neighbor in items:
-            if neighbor.to_cog_id in seen:
-                continue
-            if allowed is not None and neighbor.to_cog_id not in allowed:
-                continue
-            if min_score is not None and neighbor.score < min_score:
-                continue
+        for pos in self._candidates(from_cog_id, seen, min_score, allowed):
             if baseline is None:
-                baseline = neighbor.score
-            if abs(baseline - neighbor.score) <= max_range:
-                grouped.append(neighbor)
+                baseline = scores[pos]
+            if abs(baseline - scores[pos]) <= max_range:
+                grouped.append(self._neighbor_at(pos))
             else:
                 break
         return grouped
 
+    def traversal(
+        self,
+        allowed: set[str] | bytearray | None = None,
+        seen: Iterable[str] = (),
+        min_score: float | None = None,
+        unseen_only: bool = True,
+    ) -> "TraversalState":
+        return TraversalState(self, allowed=allowed, seen=seen, min_score=min_score, unseen_only=unseen_only)
+
+    def allowed_mask(self, allowed: set[str]) -> bytearray:
+        """Byte mask over interned ids (1 = allowed), reusable across many traversals."""
+        size = len(self.cog_ids)
+        mask = bytearray(size)
+        for cog_id in allowed:
+            pos = self.cog_ids.get(cog_id)
+            if pos is not None and pos < size:
+                mask[pos] = 1
+        return mask
+
     @staticmethod
     def from_score_entries(
         score_set_id: str,
@@ -127,3 +424,122 @@ class NeighborIndex:
         for entry in entries:
             score_set.set(entry)
         return NeighborIndex(score_set=score_set, direction_mode=direction_mode)
+
+
+class TraversalState:
+    """Seen overlay, allowed mask and per-row cursors for one walk over a ``NeighborIndex``.
+
+    ``top_unseen`` and ``range_group`` match the index methods called with the same
+    ``seen``/``allowed``/``min_score``, but each row keeps a cursor past its leading
+    entries already known to be seen or disallowed. Seen cogs never become unseen during
+    a walk, so every entry is skipped at most once per row and a chain costs roughly the
+    number of edges it touches instead of a rescan of each row from the start. ``allowed``
+    may be a precomputed ``allowed_mask`` shared (read-only) by many walks.
+    """
+
+    def __init__(
+        self,
+        index: NeighborIndex,
+        allowed: set[str] | bytearray | None = None,
+        seen: Iterable[str] = (),
+        min_score: float | None = None,
+        unseen_only: bool = True,
+    ) -> None:
+        self.index = index
+        self.min_score = min_score
+        self.unseen_only = unseen_only
+        size = len(index.cog_ids)
+        self._seen = bytearray(size)
+        if allowed is None or isinstance(allowed, bytearray):
+            self._allowed = allowed
+        else:
+            self._allowed = index.allowed_mask(allowed)
+        self._cursors: dict[int, int] = {}
+        for cog_id in seen:
+            self.mark_seen(cog_id)
+
+    def mark_seen(self, cog_id: str) -> None:
+        if not self.unseen_only:
+            return
+        pos = self.index.cog_ids.get(cog_id)
+        if pos is not None and pos < len(self._seen):
+            self._seen[pos] = 1
+
+    def is_seen(self, cog_id: str) -> bool:
+        pos = self.index.cog_ids.get(cog_id)
+        return pos is not None and pos < len(self._seen) and bool(self._seen[pos])
+
+    def mark_seen_position(self, pos: int) -> None:
+        if self.unseen_only and pos < len(self._seen):
+            self._seen[pos] = 1
+
+    def _skipped(self, target: int) -> bool:
+        return bool(self._seen[target]) or (self._allowed is not None and not self._allowed[target])
+
+    def _first(self, row: int | None) -> tuple[int, int]:
+        """Advance the row cursor past skipped entries; return ``(first candidate, stop)``."""
+        offsets = self.index.offsets
+        if row is None or row + 1 >= len(offsets):
+            return 0, 0
+        stop = offsets[row + 1]
+        pos = self._cursors.get(row)
+        if pos is None:
+            pos = offsets[row]
+        targets = self.index.targets
+        seen = self._seen
+        allowed = self._allowed
+        while pos < stop:
+            target = targets[pos]
+            if not seen[target] and (allowed is None or allowed[target]):
+                break
+            pos += 1
+        self._cursors[row] = pos
+        return pos, stop
+
+    def next_position(self, row: int) -> int:
+        """Interned id of the best unseen, allowed neighbor of row ``row``, or ``-1``."""
+        pos, stop = self._first(row)
+        if pos >= stop:
+            return -1
+        if self.min_score is not None and self.index.scores[pos] < self.min_score:
+            return -1
+        return self.index.targets[pos]
+
+    def top_unseen(self, from_cog_id: str) -> Neighbor | None:
+        pos, stop = self._first(self.index.cog_ids.get(from_cog_id))
+        if pos >= stop:
+            return None
+        if self.min_score is not None and self.index.scores[pos] < self.min_score:
+            return None
+        return self.index._neighbor_at(pos)
+
+    def range_group(self, from_cog_id: str, max_range: float) -> list[Neighbor]:
+        pos, stop = self._first(self.index.cog_ids.get(from_cog_id))
+        scores = self.index.scores
+        targets = self.index.targets
+        grouped: list[Neighbor] = []
+        if pos >= stop:
+            return grouped
+        baseline = scores[pos]
+        while pos < stop:
+            score = scores[pos]
+            if self.min_score is not None and score < self.min_score:
+                break
+            if not self._skipped(targets[pos]):
+                if abs(baseline - score) > max_range:
+                    break
+                grouped.append(self.index._neighbor_at(pos))
+            pos += 1
+        return grouped
+
+
+def _entry_value(entry: ScoreEntry | None) -> PairValue | None:
+    if entry is None:
+        return None
+    return (entry.score, entry.variance, entry.strategy_id)
+
+
+def _pair_value(first: ScoreEntry | None, second: ScoreEntry | None) -> PairValue | None:
+    if first is None or second is None:
+        return _entry_value(first if first is not None else second)
+    return ((first.score + second.score) / 2.0, (first.variance + second.variance) / 2.0, second.strategy_id)
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Callable, Iterable, Iterator
 
-from .index import Neighbor
+from .events import Event
+from .index import CogIdTable, Neighbor, NeighborIndex
+from .models import CogGraph, LineageOperation
 from .policy import PathPolicy
 from .system import CogSystem
 
@@ -15,9 +22,271 @@ class IterationResult:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class ChainBatch:
+    """Chains from many starts, stored as interned ids in one flat array.
+
+    Chain ``i`` (started from ``start_ids[i]``) is ``chain_ids[offsets[i]:offsets[i + 1]]``;
+    ids are positions in ``cog_ids``. Grouped neighbors are not kept; use ``build_chain``
+    for a single start when they are needed.
+    """
+
+    graph_id: str
+    start_ids: list[str]
+    offsets: array
+    chain_ids: array
+    cog_ids: CogIdTable
+
+    def __len__(self) -> int:
+        return len(self.start_ids)
+
+    def chain(self, pos: int) -> list[str]:
+        ids = self.cog_ids.ids
+        return [ids[item] for item in self.chain_ids[self.offsets[pos] : self.offsets[pos + 1]]]
+
+    def chains(self) -> dict[str, list[str]]:
+        return {start_id: self.chain(pos) for pos, start_id in enumerate(self.start_ids)}
+
+
+def _policy_key(policy: PathPolicy) -> tuple:
+    # ``tags`` is a set, so the frozen policy itself is not hashable.
+    return tuple(
+        frozenset(policy.tags) if item.name == "tags" else getattr(policy, item.name) for item in fields(policy)
+    )
+
+
+def _copy_result(result: IterationResult) -> IterationResult:
+    return IterationResult(
+        graph_id=result.graph_id,
+        chain=list(result.chain),
+        grouped_neighbors={key: list(value) for key, value in result.grouped_neighbors.items()},
+        metadata=dict(result.metadata),
+    )
+
+
+def _walk(
+    index: NeighborIndex,
+    policy: PathPolicy,
+    allowed: set[str] | bytearray,
+    start_id: str,
+    include_start: bool,
+    initial_seen: set[str] | None = None,
+) -> tuple[list[str], dict[str, list[str]]]:
+    state = index.traversal(
+        allowed=allowed,
+        seen=initial_seen or (),
+        min_score=policy.min_score,
+        unseen_only=policy.unseen_only,
+    )
+    chain: list[str] = []
+    grouped: dict[str, list[str]] = {}
+
+    if include_start:
+        chain.append(start_id)
+        state.mark_seen(start_id)
+
+    current = start_id
+    depth = 1
+    while True:
+        if policy.max_depth is not None and depth >= policy.max_depth:
+            break
+
+        if policy.group_range is not None:
+            group = state.range_group(current, max_range=policy.group_range)
+            if not group:
+                break
+            selected = group[0]
+            grouped[current] = [item.to_cog_id for item in group]
+        else:
+            selected = state.top_unseen(current)
+            if selected is None:
+                break
+
+        chain.append(selected.to_cog_id)
+        state.mark_seen(selected.to_cog_id)
+        current = selected.to_cog_id
+        depth += 1
+
+    return chain, grouped
+
+
+# Arguments shared by every chunk, installed once per worker of a ``_shared_pool``.
+_WORKER_STATE: tuple = ()
+
+
+def _install_state(state: tuple) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _shared_pool(workers: int, state: tuple) -> ProcessPoolExecutor:
+    """Return a process pool whose workers receive ``state`` once instead of per chunk."""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_install_state, initargs=(state,))
+
+
+def _walk_shared(chunk: list[tuple[int, bool]]) -> tuple[array, array]:
+    return _walk_many((*_WORKER_STATE, chunk))
+
+
+def _sweep_shared(subsets: list[frozenset[int]]) -> tuple[list[tuple[list[str], dict[str, list[str]]]], int]:
+    return _sweep_chunk((*_WORKER_STATE, subsets))
+
+
+def _walk_many(
+    payload: tuple[NeighborIndex, PathPolicy, bytearray, list[tuple[int, bool]]],
+) -> tuple[array, array]:
+    """Walk chains over interned ids, without building ``Neighbor`` objects."""
+    index, policy, allowed, starts = payload
+    # The first member of a range group is the top unseen neighbor, so groups only
+    # matter for whether a step exists at all.
+    stalled = policy.group_range is not None and policy.group_range < 0
+    lengths = array("q")
+    chain_ids = array("i")
+    for start, include_start in starts:
+        state = index.traversal(allowed=allowed, min_score=policy.min_score, unseen_only=policy.unseen_only)
+        first = len(chain_ids)
+        if include_start:
+            chain_ids.append(start)
+            state.mark_seen_position(start)
+        current = start
+        depth = 1
+        while not stalled and (policy.max_depth is None or depth < policy.max_depth):
+            selected = state.next_position(current)
+            if selected < 0:
+                break
+            chain_ids.append(selected)
+            state.mark_seen_position(selected)
+            current = selected
+            depth += 1
+        lengths.append(len(chain_ids) - first)
+    return lengths, chain_ids
+
+
+_BEAM_SCORES: dict[str, Callable[[tuple[float, ...]], float]] = {
+    "sum": lambda edges: float(sum(edges)),
+    "mean": lambda edges: sum(edges) / len(edges) if edges else 0.0,
+    "min": lambda edges: min(edges) if edges else 0.0,
+}
+
+
+@dataclass(frozen=True)
+class _BeamPath:
+    chain: tuple[str, ...]
+    current: str
+    edges: tuple[float, ...] = ()
+    score: float = 0.0
+    # Position picked in each step's group; lower is greedier and breaks score ties.
+    choices: tuple[int, ...] = ()
+    grouped: tuple[tuple[str, list[str]], ...] = ()
+
+    @property
+    def rank(self) -> tuple[float, tuple[int, ...]]:
+        return (-self.score, self.choices)
+
+
+@dataclass
+class HiddenLayerSweep:
+    """Chains for many hidden-layer sets, grouped by the chain each set produced.
+
+    ``results`` maps each swept set of hidden layers to its chain; ``groups`` maps each
+    distinct chain to the sets that produced it, in first-seen order. ``walks`` counts
+    traversals actually run and ``reused`` the sets answered from a parent set's chain.
+    """
+
+    graph_id: str
+    results: dict[frozenset[int], IterationResult]
+    groups: dict[tuple[str, ...], list[frozenset[int]]]
+    walks: int = 0
+    reused: int = 0
+
+    def changed(self, reference: frozenset[int] = frozenset()) -> list[frozenset[int]]:
+        """Hidden sets whose chain differs from the chain of ``reference`` (default: none hidden)."""
+        if reference not in self.results:
+            raise ValueError(f"Hidden set was not swept: {sorted(reference)}")
+        expected = self.results[reference].chain
+        return [hidden for hidden, result in self.results.items() if result.chain != expected]
+
+
+def _hidden_subsets(layers: list[int], max_hidden: int) -> Iterator[frozenset[int]]:
+    """Yield every set of at most ``max_hidden`` layers, each after the set one layer smaller."""
+    stack: list[tuple[frozenset[int], int]] = [(frozenset(), 0)]
+    while stack:
+        hidden, first = stack.pop()
+        yield hidden
+        if len(hidden) < max_hidden:
+            for pos in range(len(layers) - 1, first - 1, -1):
+                stack.append((hidden | {layers[pos]}, pos + 1))
+
+
+def _sweep_chunk(
+    payload: tuple[NeighborIndex, PathPolicy, bytearray, dict[int, list[str]], str, list[frozenset[int]]],
+) -> tuple[list[tuple[list[str], dict[str, list[str]]]], int]:
+    """Walk each hidden set, reusing a chain already found for the set minus one layer.
+
+    Hiding cogs that a chain never visits cannot change that chain: every pick was the
+    best allowed candidate and stays so among fewer candidates. Only the recorded groups
+    lose the newly hidden cogs.
+    """
+    index, policy, base_mask, layer_nodes, start_id, subsets = payload
+    positions = index.cog_ids.positions
+    memo: dict[frozenset[int], tuple[list[str], dict[str, list[str]]]] = {}
+    results: list[tuple[list[str], dict[str, list[str]]]] = []
+    walks = 0
+    for hidden in subsets:
+        found = memo.get(hidden)
+        if found is None:
+            for layer in hidden:
+                parent = memo.get(hidden - {layer})
+                if parent is None:
+                    continue
+                removed = set(layer_nodes.get(layer, ()))
+                if removed.isdisjoint(parent[0]):
+                    found = (
+                        parent[0],
+                        {key: [item for item in value if item not in removed] for key, value in parent[1].items()},
+                    )
+                    break
+        if found is None:
+            mask = bytearray(base_mask)
+            if not policy.include_hidden_layers:
+                for layer in hidden:
+                    for cog_id in layer_nodes.get(layer, ()):
+                        mask[positions[cog_id]] = 0
+            found = _walk(index, policy, mask, start_id, bool(mask[positions[start_id]]))
+            walks += 1
+        memo[hidden] = found
+        results.append(found)
+    return results, walks
+
+
+StopPredicate = Callable[[IterationResult, "IterationResult | None"], bool]
+
+
+def stop_when_unchanged(result: IterationResult, previous: IterationResult | None) -> bool:
+    """``iter_auto`` stop predicate: stop once a pass repeats the previous chain."""
+    return previous is not None and result.chain == previous.chain
+
+
+def stop_after(seconds: float) -> StopPredicate:
+    """``iter_auto`` stop predicate: stop after ``seconds`` of wall time from now."""
+    deadline = time.monotonic() + seconds
+
+    def predicate(result: IterationResult, previous: IterationResult | None) -> bool:
+        return time.monotonic() >= deadline
+
+    return predicate
+
+
 class IterationEngine:
-    def __init__(self, system: CogSystem) -> None:
+    def __init__(self, system: CogSystem, chain_cache_size: int = 256) -> None:
+        if chain_cache_size < 0:
+            raise ValueError("chain_cache_size must be non-negative.")
         self.system = system
+        self.chain_cache_size = chain_cache_size
+        self.chain_cache_hits = 0
+        self.chain_cache_misses = 0
+        self._chain_cache: OrderedDict[tuple, tuple[CogGraph, NeighborIndex, IterationResult]] = OrderedDict()
+        system.event_bus.subscribe("scores.updated", self._on_scores_updated, weak=True)
 
     def build_chain(
         self,
@@ -26,53 +295,273 @@ class IterationEngine:
         start_cog_id: str | None = None,
         initial_seen: set[str] | None = None,
     ) -> IterationResult:
+        """Build one greedy chain, served from the chain cache when its inputs are unchanged.
+
+        Results are cached by graph id and version, score-set id and version, policy,
+        start cog and seen overlay. A hit also requires the same graph and neighbor index
+        objects, so replaced score sets or loaded snapshots never match old entries.
+        """
         graph = self.system.graphs[graph_id]
         index = self.system.neighbor_index(policy.score_set_id, policy.direction_mode)
 
         start_id = start_cog_id or graph.base_cog_id
+        key = (
+            graph_id,
+            graph.version,
+            policy.score_set_id,
+            self.system.score_sets[policy.score_set_id].version,
+            _policy_key(policy),
+            start_id,
+            frozenset(initial_seen or ()) if policy.unseen_only else frozenset(),
+        )
+        cached = self._chain_cache.get(key)
+        if cached is not None and cached[0] is graph and cached[1] is index:
+            self._chain_cache.move_to_end(key)
+            self.chain_cache_hits += 1
+            return _copy_result(cached[2])
+        self.chain_cache_misses += 1
+
         allowed = self._allowed_nodes(graph_id, policy)
-        seen = set(initial_seen or set())
-        chain: list[str] = []
-        grouped: dict[str, list[str]] = {}
+        chain, grouped = _walk(index, policy, allowed, start_id, start_id in allowed, initial_seen)
+        result = IterationResult(graph_id=graph_id, chain=chain, grouped_neighbors=grouped)
+        if self.chain_cache_size:
+            self._chain_cache[key] = (graph, index, _copy_result(result))
+            self._chain_cache.move_to_end(key)
+            while len(self._chain_cache) > self.chain_cache_size:
+                self._chain_cache.popitem(last=False)
+        return result
 
-        if start_id in allowed:
-            chain.append(start_id)
-            seen.add(start_id)
+    def chain_cache_stats(self) -> dict[str, float]:
+        lookups = self.chain_cache_hits + self.chain_cache_misses
+        return {
+            "hits": float(self.chain_cache_hits),
+            "misses": float(self.chain_cache_misses),
+            "hit_rate": self.chain_cache_hits / lookups if lookups else 0.0,
+            "entries": float(len(self._chain_cache)),
+            "max_entries": float(self.chain_cache_size),
+        }
 
-        current = start_id
+    def clear_chain_cache(self) -> None:
+        self._chain_cache.clear()
+
+    def close(self) -> None:
+        """Stop listening to the system and drop the chain cache; later chains are not cached.
+
+        The subscription is weak, so an unreferenced engine is collected without this;
+        ``close`` releases the cache right away for engines that stay referenced.
+        """
+        self.system.event_bus.unsubscribe("scores.updated", self._on_scores_updated)
+        self.chain_cache_size = 0
+        self._chain_cache.clear()
+
+    def _on_scores_updated(self, event: Event) -> None:
+        score_set_id = event.payload.get("score_set_id")
+        for key in [key for key in self._chain_cache if score_set_id is None or key[2] == score_set_id]:
+            del self._chain_cache[key]
+
+    def build_chains(
+        self,
+        graph_id: str,
+        policy: PathPolicy,
+        start_ids: list[str] | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 64,
+        workers: int | None = None,
+    ) -> ChainBatch:
+        """Build one chain per start (default: every graph node) with shared preparation.
+
+        The neighbor index, allowed mask and policy filters are resolved once. With an
+        ``executor`` the starts are split into ``chunk_size`` chunks; a process pool receives
+        a pickled copy of the index per chunk. ``workers`` instead starts a pool whose
+        workers receive the index, policy and mask once, so chunks carry only their starts.
+        Chains equal ``build_chain(start_cog_id=...)``.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        graph = self.system.graphs[graph_id]
+        index = self.system.neighbor_index(policy.score_set_id, policy.direction_mode)
+        starts = list(graph.ordered_ids if start_ids is None else start_ids)
+        allowed = self._allowed_nodes(graph_id, policy)
+        jobs = [(index.cog_ids.intern(start_id), start_id in allowed) for start_id in starts]
+        mask = index.allowed_mask(allowed)
+        chunks = [jobs[pos : pos + chunk_size] for pos in range(0, len(jobs), chunk_size)]
+
+        if executor is None and workers is not None and workers > 1 and len(chunks) > 1:
+            with _shared_pool(workers, (index, policy, mask)) as pool:
+                parts = list(pool.map(_walk_shared, chunks))
+        elif executor is None or len(chunks) <= 1:
+            parts = [_walk_many((index, policy, mask, chunk)) for chunk in chunks]
+        else:
+            parts = list(executor.map(_walk_many, [(index, policy, mask, chunk) for chunk in chunks]))
+
+        offsets = array("q", [0])
+        chain_ids = array("i")
+        for lengths, part_ids in parts:
+            for length in lengths:
+                offsets.append(offsets[-1] + length)
+            chain_ids.extend(part_ids)
+        return ChainBatch(
+            graph_id=graph_id,
+            start_ids=starts,
+            offsets=offsets,
+            chain_ids=chain_ids,
+            cog_ids=index.cog_ids,
+        )
+
+    def best_chains(
+        self,
+        graph_id: str,
+        policy: PathPolicy,
+        start_cog_id: str | None = None,
+        initial_seen: set[str] | None = None,
+    ) -> list[IterationResult]:
+        """Return the ``policy.beam_top_k`` best chains found by beam search.
+
+        Each step expands every partial chain into its ``range_group`` (when
+        ``group_range`` is set) or ``equivalent_group`` alternatives and keeps the
+        ``beam_width`` best by ``beam_score`` over edge scores; ties prefer the greedy
+        choice, so a width of 1 reproduces ``build_chain``. Partial chains that reach the
+        same cog with the same visited set are merged, keeping the best-scoring one.
+        """
+        if policy.beam_score not in _BEAM_SCORES:
+            raise ValueError(f"Unsupported beam score: {policy.beam_score}")
+        if policy.beam_top_k < 1:
+            raise ValueError("beam_top_k must be at least 1.")
+        if policy.beam_width is not None and policy.beam_width < 1:
+            raise ValueError("beam_width must be at least 1.")
+        if not policy.unseen_only and policy.max_depth is None:
+            raise ValueError("Beam search needs unseen_only or max_depth to terminate.")
+        graph = self.system.graphs[graph_id]
+        index = self.system.neighbor_index(policy.score_set_id, policy.direction_mode)
+        start_id = start_cog_id or graph.base_cog_id
+        allowed = self._allowed_nodes(graph_id, policy)
+        combine = _BEAM_SCORES[policy.beam_score]
+        width = policy.beam_width or 1
+        base_seen = set(initial_seen or set()) if policy.unseen_only else set()
+
+        start = _BeamPath(chain=(start_id,) if start_id in allowed else (), current=start_id)
+        active = [start]
+        finished: list[_BeamPath] = []
         depth = 1
-        while True:
+        while active:
             if policy.max_depth is not None and depth >= policy.max_depth:
+                finished.extend(active)
                 break
-
-            if policy.group_range is not None:
-                group = index.range_group(
-                    from_cog_id=current,
-                    max_range=policy.group_range,
-                    seen=seen if policy.unseen_only else set(),
-                    min_score=policy.min_score,
-                    allowed=allowed,
-                )
+            best: dict[tuple[str, frozenset[str]], _BeamPath] = {}
+            for path in active:
+                seen = base_seen | set(path.chain) if policy.unseen_only else set()
+                if policy.group_range is not None:
+                    group = index.range_group(
+                        from_cog_id=path.current,
+                        max_range=policy.group_range,
+                        seen=seen,
+                        min_score=policy.min_score,
+                        allowed=allowed,
+                    )
+                else:
+                    group = self.equivalent_group(path.current, policy, seen=seen, allowed=allowed)
                 if not group:
-                    break
-                selected = group[0]
-                grouped[current] = [item.to_cog_id for item in group]
-            else:
-                selected = index.top_unseen(
-                    from_cog_id=current,
-                    seen=seen if policy.unseen_only else set(),
-                    min_score=policy.min_score,
-                    allowed=allowed,
+                    finished.append(path)
+                    continue
+                grouped = [item.to_cog_id for item in group]
+                for choice, neighbor in enumerate(group):
+                    edges = (*path.edges, neighbor.score)
+                    candidate = _BeamPath(
+                        chain=(*path.chain, neighbor.to_cog_id),
+                        current=neighbor.to_cog_id,
+                        edges=edges,
+                        score=combine(edges),
+                        choices=(*path.choices, choice),
+                        grouped=(*path.grouped, (path.current, grouped)) if policy.group_range is not None else (),
+                    )
+                    key = (candidate.current, frozenset(candidate.chain))
+                    kept = best.get(key)
+                    if kept is None or candidate.rank < kept.rank:
+                        best[key] = candidate
+            active = sorted(best.values(), key=lambda item: item.rank)[:width]
+            depth += 1
+
+        finished.sort(key=lambda item: item.rank)
+        results: list[IterationResult] = []
+        for rank, path in enumerate(finished[: policy.beam_top_k], start=1):
+            results.append(
+                IterationResult(
+                    graph_id=graph_id,
+                    chain=list(path.chain),
+                    grouped_neighbors=dict(path.grouped),
+                    metadata={"beam_rank": str(rank), "path_score": repr(path.score)},
                 )
-                if selected is None:
-                    break
+            )
+        return results
 
-            chain.append(selected.to_cog_id)
-            seen.add(selected.to_cog_id)
-            current = selected.to_cog_id
-            depth += 1
+    def sweep_hidden_layers(
+        self,
+        graph_id: str,
+        policy: PathPolicy,
+        subsets: Iterable[Iterable[int]] | None = None,
+        max_hidden: int | None = None,
+        start_cog_id: str | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 256,
+        workers: int | None = None,
+    ) -> HiddenLayerSweep:
+        """Build a chain for each set of hidden layers without mutating the graph.
 
-        return IterationResult(graph_id=graph_id, chain=chain, grouped_neighbors=grouped)
+        Pass explicit ``subsets`` or ``max_hidden`` to sweep every set of at most that many
+        non-base layers. Each set replaces ``graph.hidden_layers`` for its walk. Sets are
+        visited so that a set follows the set one layer smaller, whose chain is reused when
+        the extra layer holds none of its cogs. With an ``executor``, chunks of
+        ``chunk_size`` sets run in parallel (reuse then only applies within a chunk);
+        ``workers`` starts a pool that receives the index and layers once per worker.
+        """
+        if subsets is None and max_hidden is None:
+            raise ValueError("sweep_hidden_layers needs subsets or max_hidden.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        graph = self.system.graphs[graph_id]
+        index = self.system.neighbor_index(policy.score_set_id, policy.direction_mode)
+        start_id = start_cog_id or graph.base_cog_id
+        nodes = graph.node_map()
+        layer_nodes: dict[int, list[str]] = {}
+        for cog_id, node in nodes.items():
+            index.cog_ids.intern(cog_id)
+            layer_nodes.setdefault(node.layer, []).append(cog_id)
+        index.cog_ids.intern(start_id)
+        base_mask = index.allowed_mask(set(nodes))
+
+        if subsets is not None:
+            ordered = [frozenset(hidden) for hidden in subsets]
+        else:
+            if max_hidden is not None and max_hidden < 0:
+                raise ValueError("max_hidden must be non-negative.")
+            layers = sorted(layer for layer in layer_nodes if layer != 0)
+            ordered = list(_hidden_subsets(layers, max_hidden or 0))
+
+        chunks = [ordered[pos : pos + chunk_size] for pos in range(0, len(ordered), chunk_size)]
+        shared = (index, policy, base_mask, layer_nodes, start_id)
+        if executor is None and workers is not None and workers > 1 and len(chunks) > 1:
+            with _shared_pool(workers, shared) as pool:
+                parts = list(pool.map(_sweep_shared, chunks))
+        elif executor is None or len(chunks) <= 1:
+            parts = [_sweep_chunk((*shared, chunk)) for chunk in chunks]
+        else:
+            parts = list(executor.map(_sweep_chunk, [(*shared, chunk) for chunk in chunks]))
+
+        sweep = HiddenLayerSweep(graph_id=graph_id, results={}, groups={})
+        for chunk, (found, walks) in zip(chunks, parts):
+            sweep.walks += walks
+            sweep.reused += len(chunk) - walks
+            for hidden, (chain, grouped) in zip(chunk, found):
+                if hidden in sweep.results:
+                    continue
+                sweep.results[hidden] = IterationResult(
+                    graph_id=graph_id,
+                    chain=list(chain),
+                    grouped_neighbors={key: list(value) for key, value in grouped.items()},
+                    metadata={"hidden_layers": ",".join(str(layer) for layer in sorted(hidden))},
+                )
+                sweep.groups.setdefault(tuple(chain), []).append(hidden)
+        return sweep
 
     def run_manual_reorder(self, graph_id: str, policy: PathPolicy) -> None:
         self.system.reorder_graph(graph_id=graph_id, policy=policy)
@@ -91,18 +580,100 @@ class IterationEngine:
         iterations: int = 1,
         advance_base: bool = False,
     ) -> list[IterationResult]:
-        results: list[IterationResult] = []
-        for step in range(iterations):
-            self.system.reorder_graph(graph_id=graph_id, policy=policy)
-            result = self.build_chain(graph_id=graph_id, policy=policy)
-            result.metadata["iteration"] = str(step + 1)
-            results.append(result)
+        """Collect ``iter_auto`` into a list."""
+        return list(self.iter_auto(graph_id, policy, iterations=iterations, advance_base=advance_base))
+
+    def iter_auto(
+        self,
+        graph_id: str,
+        policy: PathPolicy,
+        iterations: int | None = 1,
+        advance_base: bool = False,
+        stop: StopPredicate | None = None,
+        keep_lineage: bool = True,
+    ) -> Iterator[IterationResult]:
+        """Reorder and build a chain per pass, yielding each result as soon as it is ready.
+
+        ``iterations=None`` runs until a stop condition. A pass whose inputs (base,
+        partitions, hidden layers and score-set version) match the previous pass reuses its
+        chain without reordering again (unless the partitions were permuted since, in which
+        case only the reorder is redone); reused results carry ``metadata["reused"] = "true"``.
+        The last result gets ``metadata["stop_reason"]``: ``"base_cycle"`` when
+        ``advance_base`` leads back to an input state already seen, or ``"predicate"`` when
+        ``stop(result, previous_result)`` returns true (see ``stop_when_unchanged`` and
+        ``stop_after``). With ``keep_lineage=False`` the records this loop wrote for earlier
+        passes are removed, leaving only those of the latest pass that wrote any; other
+        records are untouched.
+        """
+        graph = self.system.graphs[graph_id]
+        states: set[tuple] = set()
+        previous: tuple[tuple, IterationResult, tuple] | None = None
+        kept: list[LineageOperation] = []
+        state = self._auto_state(graph_id, policy)
+        step = 0
+        while iterations is None or step < iterations:
+            records: list[LineageOperation] = []
+            if previous is not None and previous[0] == state:
+                result = _copy_result(previous[1])
+                result.metadata = {"reused": "true"}
+                # The state ignores order, so a caller may have permuted the partitions
+                # since the reused pass; reordering restores the order its chain assumes.
+                if (graph.adjacent_order, graph.layered_order) != previous[2]:
+                    records += self._recorded(lambda: self.system.reorder_graph(graph_id=graph_id, policy=policy))
+            else:
+                records += self._recorded(lambda: self.system.reorder_graph(graph_id=graph_id, policy=policy))
+                result = self.build_chain(graph_id=graph_id, policy=policy)
+            step += 1
+            result.metadata["iteration"] = str(step)
+            prior = previous[1] if previous is not None else None
+            states.add(state)
+            previous = (state, result, (list(graph.adjacent_order), list(graph.layered_order)))
 
             if advance_base and len(result.chain) > 1:
                 next_base = result.chain[1]
-                self.system.set_graph_base(graph_id=graph_id, new_base_cog_id=next_base)
+                records += self._recorded(
+                    lambda: self.system.set_graph_base(graph_id=graph_id, new_base_cog_id=next_base)
+                )
+            state = self._auto_state(graph_id, policy)
 
-        return results
+            # A reused pass writes nothing, so the records that produced the current graph stay.
+            if records:
+                if not keep_lineage and kept:
+                    dropped = {id(record) for record in kept}
+                    self.system.lineage[:] = [record for record in self.system.lineage if id(record) not in dropped]
+                kept = records
+
+            if advance_base and state in states:
+                result.metadata["stop_reason"] = "base_cycle"
+            elif stop is not None and stop(result, prior):
+                result.metadata["stop_reason"] = "predicate"
+            yield result
+            if "stop_reason" in result.metadata:
+                return
+
+    def _recorded(self, action: Callable[[], object]) -> list[LineageOperation]:
+        """Run ``action`` and return the lineage records it appended."""
+        lineage = self.system.lineage
+        start = len(lineage)
+        action()
+        return lineage[start:] if lineage is self.system.lineage else []
+
+    def _auto_state(self, graph_id: str, policy: PathPolicy) -> tuple:
+        """Everything a reorder plus chain depends on for one ``run_auto`` policy.
+
+        Reordering (plain or pseudo-base) depends on the partitions' contents, not their
+        current order, so the partitions enter the state as sets.
+        """
+        graph = self.system.graphs[graph_id]
+        score_set = self.system.score_sets.get(policy.score_set_id)
+        return (
+            graph.base_cog_id,
+            frozenset(graph.adjacent_order),
+            frozenset(graph.layered_order),
+            frozenset(graph.hidden_layers),
+            id(score_set),
+            score_set.version if score_set is not None else None,
+        )
 
     def equivalent_group(
         self,
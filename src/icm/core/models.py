@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import Any, Iterable, Literal, Mapping
 
 
 def utc_now_iso() -> str:
@@ -90,6 +90,10 @@ class ScoreEntry:
     strategy_id: str = "default"
 
 
+def rank_key(item: ScoreEntry) -> tuple[float, float, str]:
+    return (-item.score, item.variance, item.to_cog_id)
+
+
 @dataclass
 class ScoreSet:
     id: str
@@ -97,18 +101,79 @@ class ScoreSet:
     context_hash: str = "default"
     version: int = 1
     entries: dict[tuple[str, str], ScoreEntry] = field(default_factory=dict)
+    top_k: int | None = None
+    min_score: float | None = None
+    lean: bool = False
+    candidates: dict[str, list[str]] | None = None
+
+    def __post_init__(self) -> None:
+        # Per-source rows mirroring ``entries``; kept in sync by ``set`` and ``replace_row``.
+        self._rows: dict[str, dict[str, ScoreEntry]] = {}
+        for entry in self.entries.values():
+            self._rows.setdefault(entry.from_cog_id, {})[entry.to_cog_id] = entry
+        # Reverse of ``candidates`` (target -> sources), built on first use.
+        self._candidate_sources: dict[str, list[str]] | None = None
+
+    @property
+    def sparse(self) -> bool:
+        return self.top_k is not None or self.min_score is not None
 
     def set(self, entry: ScoreEntry) -> None:
         self.entries[(entry.from_cog_id, entry.to_cog_id)] = entry
+        self._rows.setdefault(entry.from_cog_id, {})[entry.to_cog_id] = entry
 
     def get(self, from_cog_id: str, to_cog_id: str) -> ScoreEntry | None:
         return self.entries.get((from_cog_id, to_cog_id))
 
+    def row(self, from_cog_id: str) -> Mapping[str, ScoreEntry]:
+        """Return one source's entries keyed by target id (a live view; do not mutate)."""
+        return self._rows.get(from_cog_id, {})
+
+    def source_ids(self) -> list[str]:
+        return [from_cog_id for from_cog_id, row in self._rows.items() if row]
+
     def neighbors(self, from_cog_id: str) -> list[ScoreEntry]:
-        result = [entry for (src, _), entry in self.entries.items() if src == from_cog_id]
-        result.sort(key=lambda item: (-item.score, item.variance, item.to_cog_id))
+        result = list(self.row(from_cog_id).values())
+        result.sort(key=rank_key)
         return result
 
+    def select_row(self, entries: Iterable[ScoreEntry]) -> list[ScoreEntry]:
+        """Rank one source row and apply the sparse ``min_score`` and ``top_k`` limits."""
+        kept = [entry for entry in entries if self.min_score is None or entry.score >= self.min_score]
+        kept.sort(key=rank_key)
+        return kept if self.top_k is None else kept[: self.top_k]
+
+    def candidate_sources(self, to_cog_id: str) -> list[str]:
+        """Return the sources whose candidate list holds ``to_cog_id``."""
+        if self.candidates is None:
+            return []
+        if self._candidate_sources is None:
+            inverse: dict[str, list[str]] = {}
+            for from_cog_id, to_cog_ids in self.candidates.items():
+                for target_id in to_cog_ids:
+                    inverse.setdefault(target_id, []).append(from_cog_id)
+            self._candidate_sources = inverse
+        return self._candidate_sources.get(to_cog_id, [])
+
+    def add_candidates(self, from_cog_id: str, to_cog_ids: Iterable[str]) -> None:
+        """Append targets to one source's candidate list, keeping ``candidate_sources`` in sync."""
+        if self.candidates is None:
+            self.candidates = {}
+        current = self.candidates.setdefault(from_cog_id, [])
+        for target_id in to_cog_ids:
+            if target_id in current:
+                continue
+            current.append(target_id)
+            if self._candidate_sources is not None:
+                self._candidate_sources.setdefault(target_id, []).append(from_cog_id)
+
+    def replace_row(self, old: Iterable[ScoreEntry], new: Iterable[ScoreEntry]) -> None:
+        for entry in old:
+            self.entries.pop((entry.from_cog_id, entry.to_cog_id), None)
+            self._rows.get(entry.from_cog_id, {}).pop(entry.to_cog_id, None)
+        for entry in new:
+            self.set(entry)
+
 
 @dataclass
 class LineageOperation:
@@ -16,4 +16,11 @@ class PathPolicy:
     group_range: float | None = None
     min_score: float | None = None
     max_depth: int | None = None
+    # Beam search (``IterationEngine.best_chains``): partial chains kept per step, how a
+    # chain's edge scores are combined ("sum", "mean" or "min") and how many chains return.
+    beam_width: int | None = None
+    beam_score: Literal["sum", "mean", "min"] = "sum"
+    beam_top_k: int = 1
+    # Pseudo-base reorder: runs of N cogs are picked greedily, each run anchored on the last one.
+    pseudo_base_every: int | None = None
     tags: set[str] = field(default_factory=set)
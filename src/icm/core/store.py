@@ -42,6 +42,10 @@ class JsonSnapshotStore:
                 strategy_id=data["strategy_id"],
                 context_hash=data.get("context_hash", "default"),
                 version=data.get("version", 1),
+                top_k=data.get("top_k"),
+                min_score=data.get("min_score"),
+                lean=bool(data.get("lean", False)),
+                candidates=data.get("candidates"),
             )
             for entry_data in data.get("entries", []):
                 score_set.set(
@@ -112,6 +116,10 @@ class JsonSnapshotStore:
                     "id": "str",
                     "strategy_id": "str",
                     "context_hash": "str",
+                    "top_k": "optional int, sparse rows keep at most this many entries",
+                    "min_score": "optional float, sparse rows drop entries below this score",
+                    "lean": "bool, entries omit explanation vectors",
+                    "candidates": "optional {cog id: [cog ids]}, targets each source is scored against",
                     "entries": ["ScoreEntry"],
                 }
             },
@@ -144,15 +152,12 @@ class JsonSnapshotStore:
                     "strategy_id": score_set.strategy_id,
                     "context_hash": score_set.context_hash,
                     "version": score_set.version,
+                    "top_k": score_set.top_k,
+                    "min_score": score_set.min_score,
+                    "lean": score_set.lean,
+                    "candidates": score_set.candidates,
                     "entries": [
-                        {
-                            "from_cog_id": entry.from_cog_id,
-                            "to_cog_id": entry.to_cog_id,
-                            "score": entry.score,
-                            "vector": entry.vector,
-                            "variance": entry.variance,
-                            "strategy_id": entry.strategy_id,
-                        }
+                        JsonSnapshotStore._serialize_entry(entry, score_set.lean)
                         for entry in score_set.entries.values()
                     ],
                 }
@@ -169,6 +174,20 @@ class JsonSnapshotStore:
             ],
         }
 
+    @staticmethod
+    def _serialize_entry(entry: ScoreEntry, lean: bool) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "from_cog_id": entry.from_cog_id,
+            "to_cog_id": entry.to_cog_id,
+            "score": entry.score,
+            "vector": entry.vector,
+            "variance": entry.variance,
+            "strategy_id": entry.strategy_id,
+        }
+        if lean:
+            del data["vector"]
+        return data
+
     @staticmethod
     def _serialize_cog(cog: Cog) -> dict[str, Any]:
         return {
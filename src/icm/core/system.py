@@ -1,22 +1,42 @@
 from __future__ import annotations
 
+import heapq
+import os
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import asdict
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 from .events import Event, EventBus
-from .index import NeighborIndex
-from .models import Cog, CogGraph, Component, LineageOperation, ScoreEntry, ScoreSet, Snapshot
+from .feature_cache import FeatureCache, text_digest
+from .feature_table import FeatureTable
+from .index import CogIdTable, EntryChange, NeighborIndex
+from .models import Cog, CogGraph, Component, LineageOperation, ScoreEntry, ScoreSet, Snapshot, rank_key
 from .policy import PathPolicy
+from ..scoring.candidates import CandidateGenerator
 from ..scoring.features import (
     AlphabetPolarBreadthTechnique,
     FeatureTechnique,
     LetterDepthTechnique,
     LetterVolumeTechnique,
+    TextProfile,
 )
-from ..scoring.plugins import load_feature_techniques
+from ..scoring.parallel import (
+    score_pairs,
+    ScoringPool,
+    score_pairs_both_ways,
+    score_pairs_parallel,
+    score_rows,
+    score_rows_parallel,
+)
+from ..scoring.plugins import load_feature_techniques, supports_calculate_many
 from ..scoring.presets import build_weighted_strategy_from_preset, list_weighted_strategy_presets
-from ..scoring.strategies import SimilarityStrategy
+from ..scoring.scheduler import FeatureScheduler, calculate_values, checked_values
+from ..scoring.strategies import SimilarityStrategy, _normalize_namespaced_values
+
+# Source rows scored per pass when building sparse score sets, bounding peak memory.
+_SPARSE_BLOCK_ROWS = 256
 
 
 class CogSystem:
@@ -30,9 +50,25 @@ class CogSystem:
         self.feature_techniques: dict[str, FeatureTechnique] = {}
         self.default_feature_techniques: dict[str, dict[str, str]] = {}
         self.graph_policies: dict[str, PathPolicy] = {}
+        self.feature_table = FeatureTable()
+        self.feature_cache = FeatureCache()
+        self._text_profiles: dict[str, TextProfile] = {}
+        self._text_digests: dict[str, tuple[str, bytes]] = {}
+        self._feature_inputs: dict[str, tuple[int, str, int, dict[str, dict[str, str]]]] = {}
+        self._technique_version = 0
+        self.feature_scheduler: FeatureScheduler | None = None
+        self.scoring_executor: Executor | None = None
+        self.parallel_min_pairs = 250_000
+        self.parallel_shards: int | None = None
         self._neighbor_indexes: dict[tuple[str, str], NeighborIndex] = {}
+        self._segment_orders: dict[tuple[str, str], tuple[ScoreSet, int, dict]] = {}
+        self._candidate_generators: dict[str, CandidateGenerator] = {}
+        self.cog_ids = CogIdTable()
         self.lineage: list[LineageOperation] = []
+        self._batch_depth = 0
+        self._batch_dirty: dict[str, None] = {}
         self.event_bus.subscribe("cog.updated", self._on_cog_updated)
+        self.event_bus.subscribe("cogs.updated", self._on_cogs_updated)
         self.event_bus.subscribe("scores.updated", self._on_scores_updated)
 
     def register_strategy(self, strategy: SimilarityStrategy) -> None:
@@ -57,6 +93,8 @@ class CogSystem:
 
     def register_feature_technique(self, technique: FeatureTechnique, use_as_default: bool = True) -> None:
         self.feature_techniques[technique.id] = technique
+        self.feature_cache.invalidate(technique.id)
+        self._technique_version += 1
         if use_as_default:
             self.default_feature_techniques.setdefault(technique.namespace, {})[
                 technique.feature_name
@@ -76,26 +114,185 @@ class CogSystem:
         return ids
 
     def recompute_cog_features(self, cog_id: str) -> Cog:
-        cog = self.cogs[cog_id]
+        return self.recompute_features([cog_id])[0]
+
+    def recompute_features(self, cog_ids: list[str] | None = None) -> list[Cog]:
+        """Recompute derived features for many cogs, one technique at a time.
+
+        A technique exposing ``calculate_many(cogs)`` receives every cog that uses it in a
+        single call; other techniques are called per cog. All values are computed before
+        any cog is updated, so techniques should not read other techniques' outputs.
+
+        Text-only (``calculate_with_profile``) values are memoized in ``feature_cache``.
+        A cog whose text, technique assignment and ``scoring.version`` are unchanged since
+        its last recompute, and that only uses text-only techniques, reuses its previous
+        values without touching its text at all.
+        """
+        ids = list(self.cogs.keys()) if cog_ids is None else cog_ids
+        cogs = [self.cogs[cog_id] for cog_id in ids]
+        technique_maps = [self._resolve_feature_techniques(cog) for cog in cogs]
+
+        rows_by_technique: dict[str, list[int]] = {}
+        values_by_technique: dict[str, dict[int, float]] = {}
+        for row, technique_map in enumerate(technique_maps):
+            for feature_map in technique_map.values():
+                for technique_id in feature_map.values():
+                    if technique_id not in self.feature_techniques:
+                        raise ValueError(f"Unknown feature technique: {technique_id}")
+            previous = self._previous_feature_values(cogs[row], technique_map)
+            for namespace, feature_map in technique_map.items():
+                for feature_name, technique_id in feature_map.items():
+                    if previous is not None:
+                        values_by_technique.setdefault(technique_id, {})[row] = previous[namespace][feature_name]
+                        continue
+                    rows = rows_by_technique.setdefault(technique_id, [])
+                    if not rows or rows[-1] != row:
+                        rows.append(row)
+            if previous is not None:
+                self.feature_cache.skipped += 1
+
+        # Techniques see cogs without their previous derived keys; a failing technique
+        # restores every cog's features before any new value has been written.
+        saved_features = [dict(cog.features) for cog in cogs]
+        for cog in cogs:
+            for key in set(cog.scoring.metadata.get("derived_feature_keys", [])):
+                cog.features.pop(key, None)
+
+        jobs = [
+            (self.feature_techniques[technique_id], [cogs[row] for row in rows])
+            for technique_id, rows in rows_by_technique.items()
+        ]
+        try:
+            if self.feature_scheduler is not None:
+                results = self.feature_scheduler.run(jobs, self._calculate_many)
+            else:
+                results = [self._calculate_many(technique, job_cogs) for technique, job_cogs in jobs]
+        except BaseException:
+            for cog, features in zip(cogs, saved_features):
+                cog.features.clear()
+                cog.features.update(features)
+            raise
+        for (technique_id, rows), values in zip(rows_by_technique.items(), results):
+            values_by_technique.setdefault(technique_id, {}).update(zip(rows, values))
+
+        for row, cog in enumerate(cogs):
+            self._apply_features(cog, technique_maps[row], values_by_technique, row)
+            self.feature_table.upsert(cog.id, _normalize_namespaced_values(cog))
+            self._feature_inputs[cog.id] = (
+                cog.scoring.version,
+                cog.content or cog.theme,
+                self._technique_version,
+                {namespace: dict(feature_map) for namespace, feature_map in technique_maps[row].items()},
+            )
+        return cogs
+
+    def preview_features(self, cogs: list[Cog]) -> list[Cog]:
+        """Compute derived features for cogs that are not registered in this system.
+
+        Values are written onto the given cogs exactly as ``recompute_features`` would,
+        but nothing keyed by cog id is touched: ``cogs``, ``feature_table``, the text
+        profile caches and the recompute bookkeeping stay as they were. Text-only values
+        still go through ``feature_cache``, which is keyed by text digest.
+        """
+        technique_maps = [self._resolve_feature_techniques(cog) for cog in cogs]
+        rows_by_technique: dict[str, list[int]] = {}
+        for row, technique_map in enumerate(technique_maps):
+            for feature_map in technique_map.values():
+                for technique_id in feature_map.values():
+                    if technique_id not in self.feature_techniques:
+                        raise ValueError(f"Unknown feature technique: {technique_id}")
+                    rows = rows_by_technique.setdefault(technique_id, [])
+                    if not rows or rows[-1] != row:
+                        rows.append(row)
+
+        for cog in cogs:
+            for key in set(cog.scoring.metadata.get("derived_feature_keys", [])):
+                cog.features.pop(key, None)
+        values_by_technique: dict[str, dict[int, float]] = {}
+        for technique_id, rows in rows_by_technique.items():
+            technique = self.feature_techniques[technique_id]
+            values = self._calculate_detached(technique, [cogs[row] for row in rows])
+            values_by_technique[technique_id] = dict(zip(rows, values))
+        for row, cog in enumerate(cogs):
+            self._apply_features(cog, technique_maps[row], values_by_technique, row)
+        return cogs
+
+    def _calculate_detached(self, technique: FeatureTechnique, cogs: list[Cog]) -> list[float]:
+        calculate_with_profile = getattr(technique, "calculate_with_profile", None)
+        if supports_calculate_many(technique) or not callable(calculate_with_profile):
+            return calculate_values(technique, cogs)
+        values: list[float] = []
+        for cog in cogs:
+            text = cog.content or cog.theme
+            digest = text_digest(text)
+            value = self.feature_cache.get(technique.id, digest)
+            if value is None:
+                value = float(calculate_with_profile(cog, TextProfile.from_text(text)))
+                self.feature_cache.put(technique.id, digest, value)
+            values.append(value)
+        return values
+
+    def feature_cache_stats(self) -> dict[str, int]:
+        return self.feature_cache.stats()
+
+    def _previous_feature_values(
+        self,
+        cog: Cog,
+        technique_map: dict[str, dict[str, str]],
+    ) -> dict[str, dict[str, float]] | None:
+        recorded = self._feature_inputs.get(cog.id)
+        if recorded != (cog.scoring.version, cog.content or cog.theme, self._technique_version, technique_map):
+            return None
+        previous = cog.scoring.feature_values
+        for namespace, feature_map in technique_map.items():
+            for feature_name, technique_id in feature_map.items():
+                if not self._text_only(self.feature_techniques[technique_id]):
+                    return None
+                if feature_name not in previous.get(namespace, {}):
+                    return None
+        return previous
+
+    @staticmethod
+    def _text_only(technique: FeatureTechnique) -> bool:
+        return not supports_calculate_many(technique) and callable(getattr(technique, "calculate_with_profile", None))
+
+    def _resolve_feature_techniques(self, cog: Cog) -> dict[str, dict[str, str]]:
         technique_map = self._normalize_feature_techniques(cog.scoring.feature_techniques)
         for namespace, defaults in self.default_feature_techniques.items():
             namespace_map = technique_map.setdefault(namespace, {})
             for feature_name, technique_id in defaults.items():
                 namespace_map.setdefault(feature_name, technique_id)
+        return technique_map
 
-        previous_derived = set(cog.scoring.metadata.get("derived_feature_keys", []))
-        for key in previous_derived:
-            cog.features.pop(key, None)
+    def _calculate_many(self, technique: FeatureTechnique, cogs: list[Cog]) -> list[float]:
+        if supports_calculate_many(technique):
+            return checked_values(technique, technique.calculate_many(cogs), len(cogs))  # type: ignore[attr-defined]
+        calculate_with_profile = getattr(technique, "calculate_with_profile", None)
+        if not callable(calculate_with_profile):
+            return [float(technique.calculate(cog)) for cog in cogs]
+        values: list[float] = []
+        for cog in cogs:
+            digest = self._text_digest(cog)
+            value = self.feature_cache.get(technique.id, digest)
+            if value is None:
+                value = float(calculate_with_profile(cog, self._text_profile(cog)))
+                self.feature_cache.put(technique.id, digest, value)
+            values.append(value)
+        return values
 
+    def _apply_features(
+        self,
+        cog: Cog,
+        technique_map: dict[str, dict[str, str]],
+        values_by_technique: dict[str, dict[int, float]],
+        row: int,
+    ) -> None:
         feature_values: dict[str, dict[str, float]] = {}
         derived_keys: set[str] = set()
         for namespace, feature_map in technique_map.items():
             ns_values: dict[str, float] = {}
             for feature_name, technique_id in feature_map.items():
-                technique = self.feature_techniques.get(technique_id)
-                if technique is None:
-                    raise ValueError(f"Unknown feature technique: {technique_id}")
-                value = float(technique.calculate(cog))
+                value = values_by_technique[technique_id][row]
                 ns_values[feature_name] = value
                 namespaced_key = f"{namespace}.{feature_name}"
                 cog.features[namespaced_key] = value
@@ -117,15 +314,31 @@ class CogSystem:
         cog.scoring.feature_values = feature_values
         cog.scoring.metadata["derived_feature_keys"] = sorted(derived_keys)
         cog.scoring.version += 1
-        return cog
+
+    def _text_profile(self, cog: Cog) -> TextProfile:
+        text = cog.content or cog.theme
+        profile = self._text_profiles.get(cog.id)
+        if profile is None or profile.text != text:
+            profile = TextProfile.from_text(text)
+            self._text_profiles[cog.id] = profile
+        return profile
+
+    def _text_digest(self, cog: Cog) -> bytes:
+        text = cog.content or cog.theme
+        cached = self._text_digests.get(cog.id)
+        if cached is None or cached[0] != text:
+            cached = (text, text_digest(text))
+            self._text_digests[cog.id] = cached
+        return cached[1]
 
     def add_component(self, component: Component) -> None:
         self.components[component.id] = component
 
     def add_cog(self, cog: Cog) -> None:
         self.cogs[cog.id] = cog
+        self.cog_ids.intern(cog.id)
         self.recompute_cog_features(cog.id)
-        self.event_bus.publish(Event(topic="cog.updated", payload={"cog_id": cog.id}))
+        self._publish_cog_updated({"cog_id": cog.id})
 
     def update_cog(self, cog_id: str, **updates: Any) -> Cog:
         cog = self.cogs[cog_id]
@@ -135,11 +348,33 @@ class CogSystem:
             setattr(cog, key, value)
         self.recompute_cog_features(cog_id)
         cog.version += 1
-        self.event_bus.publish(
-            Event(topic="cog.updated", payload={"cog_id": cog.id, "version": cog.version})
-        )
+        self._publish_cog_updated({"cog_id": cog.id, "version": cog.version})
         return cog
 
+    @contextmanager
+    def batch(self) -> Iterator["CogSystem"]:
+        """Defer ``cog.updated`` handling until the outermost batch exits.
+
+        Cogs touched inside the batch are published once as a single ``cogs.updated``
+        event, which rescores their rows and columns once per score set, drops each
+        affected neighbor index once and reorders each bound graph once.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                cog_ids = list(self._batch_dirty)
+                self._batch_dirty.clear()
+                self.event_bus.publish(Event(topic="cogs.updated", payload={"cog_ids": cog_ids}))
+
+    def _publish_cog_updated(self, payload: dict[str, Any]) -> None:
+        if self._batch_depth > 0:
+            self._batch_dirty[payload["cog_id"]] = None
+            return
+        self.event_bus.publish(Event(topic="cog.updated", payload=payload))
+
     def add_graph(self, graph: CogGraph) -> None:
         all_ids = set(graph.ordered_ids)
         missing = [cog_id for cog_id in all_ids if cog_id not in self.cogs]
@@ -160,21 +395,88 @@ class CogSystem:
         strategy_id: str,
         context_hash: str = "default",
         cog_ids: list[str] | None = None,
+        top_k: int | None = None,
+        min_score: float | None = None,
+        candidates: CandidateGenerator | None = None,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        lean: bool = False,
     ) -> ScoreSet:
+        """Score ``cog_ids`` (default: every cog) pairwise into a new score set.
+
+        With ``candidates``, each source is scored only against the targets the generator
+        proposes. The lists are stored in ``ScoreSet.candidates`` and later rescoring keeps
+        to them; the generator is retained to propose candidates for cogs added later.
+        """
         if strategy_id not in self.strategies:
             raise ValueError(f"Unknown strategy: {strategy_id}")
-
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be at least 1.")
         strategy = self.strategies[strategy_id]
         ids = cog_ids if cog_ids is not None else list(self.cogs.keys())
-        for cog_id in ids:
-            self.recompute_cog_features(cog_id)
-        score_set = ScoreSet(id=score_set_id, strategy_id=strategy_id, context_hash=context_hash)
+        self.recompute_features(ids)
+        score_set = ScoreSet(
+            id=score_set_id,
+            strategy_id=strategy_id,
+            context_hash=context_hash,
+            top_k=top_k,
+            min_score=min_score,
+            lean=lean,
+        )
 
-        for from_cog_id in ids:
-            for to_cog_id in ids:
-                if from_cog_id == to_cog_id:
-                    continue
-                entry = strategy.score(self.cogs[from_cog_id], self.cogs[to_cog_id])
+        cogs = [self.cogs[cog_id] for cog_id in ids]
+        candidate_ids = candidates.candidates(cogs, strategy) if candidates is not None else None
+        if candidate_ids is not None:
+            score_set.candidates = {source.id: list(candidate_ids.get(source.id, [])) for source in cogs}
+        # Workers of a pool created here get the strategy and population once, not per shard.
+        pool = None
+        if executor is None and workers is not None and workers > 1:
+            pool = ScoringPool(strategy, cogs, workers)
+        try:
+            self._fill_score_set(score_set, strategy, cogs, pool or executor)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.score_sets[score_set_id] = score_set
+        if candidates is not None:
+            self._candidate_generators[score_set_id] = candidates
+        else:
+            self._candidate_generators.pop(score_set_id, None)
+        self._drop_indexes(score_set_id)
+        return score_set
+
+    def _fill_score_set(
+        self,
+        score_set: ScoreSet,
+        strategy: SimilarityStrategy,
+        cogs: list[Cog],
+        executor: Executor | ScoringPool | None,
+    ) -> None:
+        include_vectors = not score_set.lean
+        candidate_ids = score_set.candidates
+        blocked = score_set.sparse or candidate_ids is not None
+        block_rows = _SPARSE_BLOCK_ROWS if blocked else max(len(cogs), 1)
+        for start in range(0, len(cogs), block_rows):
+            # A single block is the population itself, so symmetric strategies mirror pairs.
+            block = cogs if block_rows >= len(cogs) else cogs[start : start + block_rows]
+            if candidate_ids is None:
+                entries = self._score_pairs(strategy, block, cogs, executor, include_vectors=include_vectors)
+            else:
+                entries = self._score_rows(
+                    strategy,
+                    block,
+                    [[self.cogs[target_id] for target_id in candidate_ids.get(source.id, [])] for source in block],
+                    executor,
+                    include_vectors=include_vectors,
+                )
+            if score_set.sparse:
+                entries = [
+                    entry
+                    for row in self._group_rows(entries).values()
+                    for entry in score_set.select_row(row)
+                ]
+            for entry in entries:
                 score_set.set(
                     ScoreEntry(
                         from_cog_id=entry.from_cog_id,
@@ -182,41 +484,269 @@ class CogSystem:
                         score=entry.score,
                         vector=entry.vector,
                         variance=entry.variance,
-                        strategy_id=strategy_id,
+                        strategy_id=score_set.strategy_id,
                     )
                 )
 
-        self.score_sets[score_set_id] = score_set
-        self._neighbor_indexes.pop((score_set_id, "directed"), None)
-        self._neighbor_indexes.pop((score_set_id, "symmetrized"), None)
-        return score_set
+    def explain(self, score_set_id: str, from_cog_id: str, to_cog_id: str) -> dict[str, float]:
+        """Return the explanation vector for one pair, recomputing it for lean score sets."""
+        if score_set_id not in self.score_sets:
+            raise ValueError(f"Unknown score set: {score_set_id}")
+        score_set = self.score_sets[score_set_id]
+        entry = score_set.get(from_cog_id, to_cog_id)
+        if entry is not None and entry.vector:
+            return dict(entry.vector)
+        if score_set.strategy_id not in self.strategies:
+            raise ValueError(f"Unknown strategy: {score_set.strategy_id}")
+        strategy = self.strategies[score_set.strategy_id]
+        return strategy.score(self.cogs[from_cog_id], self.cogs[to_cog_id]).vector
+
+    def candidate_recall(
+        self,
+        strategy_id: str,
+        candidates: CandidateGenerator,
+        k: int = 10,
+        cog_ids: list[str] | None = None,
+        source_ids: list[str] | None = None,
+    ) -> dict[str, float]:
+        """Measure how many exhaustive top-``k`` neighbors a candidate generator keeps.
+
+        ``source_ids`` limits the exhaustive comparison to a sample of source rows.
+        """
+        if strategy_id not in self.strategies:
+            raise ValueError(f"Unknown strategy: {strategy_id}")
+        strategy = self.strategies[strategy_id]
+        cogs = [self.cogs[cog_id] for cog_id in (cog_ids if cog_ids is not None else self.cogs)]
+        sources = cogs if source_ids is None else [self.cogs[cog_id] for cog_id in source_ids]
+        candidate_ids = candidates.candidates(cogs, strategy)
+        exhaustive = self._group_rows(self._score_pairs(strategy, sources, cogs, include_vectors=False))
+
+        hits = 0
+        expected = 0
+        for source in sources:
+            row = sorted(exhaustive.get(source.id, []), key=rank_key)
+            exact = {entry.to_cog_id for entry in row[:k]}
+            allowed = set(candidate_ids.get(source.id, []))
+            approx = {entry.to_cog_id for entry in row if entry.to_cog_id in allowed}
+            approx_top = [entry.to_cog_id for entry in row if entry.to_cog_id in approx][:k]
+            hits += len(exact.intersection(approx_top))
+            expected += len(exact)
+
+        return {
+            "recall": hits / expected if expected else 1.0,
+            "k": float(k),
+            "sources": float(len(sources)),
+            "candidate_pairs": float(sum(len(candidate_ids.get(source.id, [])) for source in sources)),
+            "exhaustive_pairs": float(len(sources) * max(len(cogs) - 1, 0)),
+        }
 
     def _on_cog_updated(self, event: Event) -> None:
         cog_id = event.payload.get("cog_id")
         if cog_id is None:
             return
+        self._rescore_cogs([cog_id])
 
+    def _on_cogs_updated(self, event: Event) -> None:
+        cog_ids = [cog_id for cog_id in event.payload.get("cog_ids", []) if cog_id in self.cogs]
+        if not cog_ids:
+            return
+        self._rescore_cogs(cog_ids)
+
+    def _rescore_cogs(self, cog_ids: list[str]) -> None:
+        dirty = set(cog_ids)
+        changed = [self.cogs[cog_id] for cog_id in cog_ids]
+        others = [other for other_id, other in self.cogs.items() if other_id not in dirty]
         for score_set in self.score_sets.values():
             if score_set.strategy_id not in self.strategies:
                 continue
             strategy = self.strategies[score_set.strategy_id]
-            ids = list(self.cogs.keys())
-            for other_id in ids:
-                if other_id == cog_id:
-                    continue
-                out_entry = strategy.score(self.cogs[cog_id], self.cogs[other_id])
-                in_entry = strategy.score(self.cogs[other_id], self.cogs[cog_id])
-                score_set.set(out_entry)
-                score_set.set(in_entry)
-            score_set.version += 1
-            self._neighbor_indexes.pop((score_set.id, "directed"), None)
-            self._neighbor_indexes.pop((score_set.id, "symmetrized"), None)
-            self.event_bus.publish(
-                Event(
-                    topic="scores.updated",
-                    payload={"score_set_id": score_set.id, "source_cog_id": cog_id},
+            indexes = self._cached_indexes(score_set.id)
+            changes: list[EntryChange] | None = [] if indexes else None
+            if score_set.sparse or score_set.candidates is not None:
+                self._rescore_sparse(score_set, strategy, changed, others, dirty, changes)
+            else:
+                out_entries, reverse_entries = self._score_both_ways(
+                    strategy, changed, list(self.cogs.values()), include_vectors=not score_set.lean
                 )
+                in_entries = [entry for entry in reverse_entries if entry.from_cog_id not in dirty]
+                if len(changed) == 1:
+                    # A single cog keeps the out/in interleaving of per-event rescoring.
+                    entries = [entry for pair in zip(out_entries, in_entries) for entry in pair]
+                else:
+                    entries = [*out_entries, *in_entries]
+                for entry in entries:
+                    if changes is not None:
+                        changes.append((score_set.get(entry.from_cog_id, entry.to_cog_id), entry))
+                    score_set.set(entry)
+            score_set.version += 1
+            self._update_indexes(score_set, indexes, changes)
+            if len(cog_ids) == 1:
+                payload: dict[str, Any] = {"score_set_id": score_set.id, "source_cog_id": cog_ids[0]}
+            else:
+                payload = {"score_set_id": score_set.id, "source_cog_ids": list(cog_ids)}
+            self.event_bus.publish(Event(topic="scores.updated", payload=payload))
+
+    def _rescore_sparse(
+        self,
+        score_set: ScoreSet,
+        strategy: SimilarityStrategy,
+        changed: list[Cog],
+        others: list[Cog],
+        dirty: set[str],
+        changes: list[EntryChange] | None = None,
+    ) -> None:
+        everyone = list(self.cogs.values())
+        include_vectors = not score_set.lean
+        current = {cog.id: list(score_set.row(cog.id).values()) for cog in [*changed, *others]}
+        if score_set.candidates is None:
+            out_entries, reverse_entries = self._score_both_ways(
+                strategy, changed, everyone, include_vectors=include_vectors
+            )
+        else:
+            out_entries, reverse_entries = self._score_candidates(
+                score_set, strategy, changed, dirty, include_vectors=include_vectors
             )
+        fresh = self._group_rows(out_entries)
+        for cog in changed:
+            self._replace_row(
+                score_set, current.get(cog.id, []), score_set.select_row(fresh.get(cog.id, [])), changes
+            )
+
+        incoming = self._group_rows(entry for entry in reverse_entries if entry.from_cog_id not in dirty)
+        stale: list[Cog] = []
+        for source in others:
+            old_row = current.get(source.id, [])
+            kept = [entry for entry in old_row if entry.to_cog_id not in dirty]
+            merged = score_set.select_row([*kept, *incoming.get(source.id, [])])
+            if score_set.top_k is not None and len(old_row) >= score_set.top_k:
+                # Pruned targets all rank after the old Kth entry; if the merged row cannot
+                # fill K slots ahead of that boundary, one of them may belong in the row.
+                boundary = max(rank_key(entry) for entry in old_row)
+                if len(merged) < score_set.top_k or rank_key(merged[-1]) > boundary:
+                    stale.append(source)
+                    continue
+            self._replace_row(score_set, old_row, merged, changes)
+
+        if stale:
+            if score_set.candidates is None:
+                stale_entries = self._score_pairs(strategy, stale, everyone, include_vectors=include_vectors)
+            else:
+                stale_entries = self._score_rows(
+                    strategy,
+                    stale,
+                    [self._candidate_targets(score_set, source.id) for source in stale],
+                    include_vectors=include_vectors,
+                )
+            rebuilt = self._group_rows(stale_entries)
+            for source in stale:
+                self._replace_row(
+                    score_set,
+                    current.get(source.id, []),
+                    score_set.select_row(rebuilt.get(source.id, [])),
+                    changes,
+                )
+
+    def _score_candidates(
+        self,
+        score_set: ScoreSet,
+        strategy: SimilarityStrategy,
+        changed: list[Cog],
+        dirty: set[str],
+        include_vectors: bool = True,
+    ) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+        """Score changed cogs towards their candidates and back from the sources listing them."""
+        self._extend_candidates(score_set, strategy, changed)
+        out_entries = self._score_rows(
+            strategy,
+            changed,
+            [self._candidate_targets(score_set, cog.id) for cog in changed],
+            include_vectors=include_vectors,
+        )
+        targets_by_source: dict[str, list[Cog]] = {}
+        for cog in changed:
+            for source_id in score_set.candidate_sources(cog.id):
+                if source_id not in dirty and source_id in self.cogs:
+                    targets_by_source.setdefault(source_id, []).append(cog)
+        in_entries = self._score_rows(
+            strategy,
+            [self.cogs[source_id] for source_id in targets_by_source],
+            list(targets_by_source.values()),
+            include_vectors=include_vectors,
+        )
+        return out_entries, in_entries
+
+    def _extend_candidates(self, score_set: ScoreSet, strategy: SimilarityStrategy, changed: list[Cog]) -> None:
+        """Give changed cogs missing from a candidate set's map their candidates.
+
+        The generator the set was created with, when still held, is rerun over the
+        population: new cogs take its lists, and existing sources it pairs with a new
+        cog gain that cog. Without a generator (e.g. after loading a snapshot) new cogs
+        get an empty list.
+        """
+        known = score_set.candidates or {}
+        new_ids = {cog.id for cog in changed if cog.id not in known}
+        if not new_ids:
+            return
+        generator = self._candidate_generators.get(score_set.id)
+        proposed = generator.candidates(list(self.cogs.values()), strategy) if generator is not None else {}
+        for cog in changed:
+            if cog.id in new_ids:
+                score_set.add_candidates(cog.id, proposed.get(cog.id, []))
+        for source_id, target_ids in proposed.items():
+            added = [target_id for target_id in target_ids if target_id in new_ids]
+            if added and source_id not in new_ids:
+                score_set.add_candidates(source_id, added)
+
+    def _candidate_targets(self, score_set: ScoreSet, source_id: str) -> list[Cog]:
+        cogs = self.cogs
+        candidates = score_set.candidates or {}
+        return [cogs[target_id] for target_id in candidates.get(source_id, []) if target_id in cogs]
+
+    @staticmethod
+    def _replace_row(
+        score_set: ScoreSet,
+        old: list[ScoreEntry],
+        new: list[ScoreEntry],
+        changes: list[EntryChange] | None,
+    ) -> None:
+        if changes is not None:
+            previous = {(entry.from_cog_id, entry.to_cog_id): entry for entry in old}
+            for entry in new:
+                before = previous.pop((entry.from_cog_id, entry.to_cog_id), None)
+                if before is not entry:
+                    changes.append((before, entry))
+            changes.extend((entry, None) for entry in previous.values())
+        score_set.replace_row(old, new)
+
+    def _cached_indexes(self, score_set_id: str) -> list[NeighborIndex]:
+        return [
+            self._neighbor_indexes[key]
+            for key in ((score_set_id, "directed"), (score_set_id, "symmetrized"))
+            if key in self._neighbor_indexes
+        ]
+
+    def _update_indexes(
+        self,
+        score_set: ScoreSet,
+        indexes: list[NeighborIndex],
+        changes: list[EntryChange] | None,
+    ) -> None:
+        """Patch cached neighbor indexes in place, or drop them when most entries changed."""
+        for direction_mode in ("directed", "symmetrized"):
+            self._segment_orders.pop((score_set.id, direction_mode), None)
+        if not indexes:
+            return
+        if changes is None or 2 * len(changes) > len(score_set.entries):
+            self._drop_indexes(score_set.id)
+            return
+        for index in indexes:
+            index.apply_changes(score_set, changes)
+
+    def _drop_indexes(self, score_set_id: str) -> None:
+        """Forget the neighbor indexes and pseudo-base run orders built from a score set."""
+        for direction_mode in ("directed", "symmetrized"):
+            self._neighbor_indexes.pop((score_set_id, direction_mode), None)
+            self._segment_orders.pop((score_set_id, direction_mode), None)
 
     def _on_scores_updated(self, event: Event) -> None:
         score_set_id = event.payload.get("score_set_id")
@@ -234,25 +764,25 @@ class CogSystem:
             return cached
         if score_set_id not in self.score_sets:
             raise ValueError(f"Unknown score set: {score_set_id}")
-        index = NeighborIndex(self.score_sets[score_set_id], direction_mode=direction_mode)
+        index = NeighborIndex(self.score_sets[score_set_id], direction_mode=direction_mode, cog_ids=self.cog_ids)
         self._neighbor_indexes[key] = index
         return index
 
     def reorder_graph(self, graph_id: str, policy: PathPolicy) -> CogGraph:
         graph = self.graphs[graph_id]
-        index = self.neighbor_index(policy.score_set_id, policy.direction_mode)
-
-        adjacent_scores = {
-            cog_id: self._score_or_neg_inf(index, graph.base_cog_id, cog_id)
-            for cog_id in graph.adjacent_order
-        }
-        layered_scores = {
-            cog_id: self._score_or_neg_inf(index, graph.base_cog_id, cog_id)
-            for cog_id in graph.layered_order
+        metadata = {
+            "graph_id": graph.id,
+            "score_set_id": policy.score_set_id,
+            "direction_mode": policy.direction_mode,
         }
-
-        graph.adjacent_order.sort(key=lambda cog_id: (-adjacent_scores[cog_id], cog_id))
-        graph.layered_order.sort(key=lambda cog_id: (-layered_scores[cog_id], cog_id))
+        if policy.pseudo_base_every is not None:
+            pseudo_bases = self._reorder_segments(graph, policy)
+            metadata["pseudo_base_every"] = str(policy.pseudo_base_every)
+            metadata["pseudo_bases"] = ",".join(pseudo_bases)
+        else:
+            base_score = self._anchor_scores(policy, graph.base_cog_id)
+            graph.adjacent_order.sort(key=lambda cog_id: (-base_score(cog_id), cog_id))
+            graph.layered_order.sort(key=lambda cog_id: (-base_score(cog_id), cog_id))
         graph.version += 1
 
         self.lineage.append(
@@ -260,15 +790,86 @@ class CogSystem:
                 op_type="reorder",
                 inputs=[graph.base_cog_id],
                 outputs=graph.ordered_ids,
-                metadata={
-                    "graph_id": graph.id,
-                    "score_set_id": policy.score_set_id,
-                    "direction_mode": policy.direction_mode,
-                },
+                metadata=metadata,
             )
         )
         return graph
 
+    def _anchor_scores(self, policy: PathPolicy, anchor: str) -> Callable[[str], float]:
+        """Return a lookup of ``anchor``'s score towards a cog (``-inf`` when unscored).
+
+        Directed lookups read the score set's own row, so nothing is built or copied;
+        symmetrized scores come from the anchor's row of the shared neighbor index.
+        """
+        missing = float("-inf")
+        if policy.direction_mode == "directed":
+            if policy.score_set_id not in self.score_sets:
+                raise ValueError(f"Unknown score set: {policy.score_set_id}")
+            row = self.score_sets[policy.score_set_id].row(anchor)
+
+            def lookup(cog_id: str) -> float:
+                entry = row.get(cog_id)
+                return missing if entry is None else entry.score
+
+            return lookup
+        scores = self.neighbor_index(policy.score_set_id, policy.direction_mode).row_scores(anchor)
+        return lambda cog_id: scores.get(cog_id, missing)
+
+    def _reorder_segments(self, graph: CogGraph, policy: PathPolicy) -> list[str]:
+        """Fill runs of ``pseudo_base_every`` layers greedily from their anchor; return the pseudo bases.
+
+        The first run is anchored on the base. Each run takes, from the cogs not yet
+        placed, the ones its anchor scores highest (adjacent slots from the adjacent
+        partition, layered slots from the layered one), and its last cog becomes the pseudo
+        base anchoring the next run. The result depends only on the partitions' contents,
+        not their current order. Picks are memoized by anchor and remaining cogs while the
+        score set is unchanged.
+        """
+        every = policy.pseudo_base_every
+        if every is None or every < 1:
+            raise ValueError("pseudo_base_every must be at least 1.")
+        if policy.score_set_id not in self.score_sets:
+            raise ValueError(f"Unknown score set: {policy.score_set_id}")
+        score_set = self.score_sets[policy.score_set_id]
+        memo_key = (policy.score_set_id, policy.direction_mode)
+        cached = self._segment_orders.get(memo_key)
+        if cached is None or cached[0] is not score_set or cached[1] != score_set.version:
+            cached = (score_set, score_set.version, {})
+            self._segment_orders[memo_key] = cached
+        memo = cached[2]
+
+        split = len(graph.adjacent_order)
+        total = split + len(graph.layered_order)
+        remaining = (set(graph.adjacent_order), set(graph.layered_order))
+        order: list[str] = []
+        anchor = graph.base_cog_id
+        lookups: dict[str, Callable[[str], float]] = {}
+        pseudo_bases: list[str] = []
+        for start in range(0, total, every):
+            stop = min(start + every, total)
+            for part, count in ((0, min(stop, split) - start), (1, stop - max(start, split))):
+                if count <= 0:
+                    continue
+                pool = remaining[part]
+                key = (anchor, frozenset(pool), count)
+                picked = memo.get(key)
+                if picked is None:
+                    score = lookups.get(anchor)
+                    if score is None:
+                        score = lookups[anchor] = self._anchor_scores(policy, anchor)
+                    ranked = heapq.nsmallest(count, pool, key=lambda cog_id: (-score(cog_id), cog_id))
+                    picked = tuple(ranked)
+                    memo[key] = picked
+                order.extend(picked)
+                pool.difference_update(picked)
+            if stop - start == every and stop < total:
+                anchor = order[stop - 1]
+                pseudo_bases.append(anchor)
+
+        graph.adjacent_order = order[:split]
+        graph.layered_order = order[split:]
+        return pseudo_bases
+
     def swap_adjacent_layered(self, graph_id: str) -> CogGraph:
         graph = self.graphs[graph_id]
         graph.adjacent_order, graph.layered_order = graph.layered_order, graph.adjacent_order
@@ -335,7 +936,16 @@ class CogSystem:
         self.graphs = deepcopy(snapshot.graphs)
         self.score_sets = deepcopy(snapshot.score_sets)
         self.lineage = deepcopy(snapshot.lineage)
+        self.feature_table.clear()
+        self._text_profiles.clear()
+        self._text_digests.clear()
+        self._feature_inputs.clear()
+        for cog in self.cogs.values():
+            self.cog_ids.intern(cog.id)
+            self.feature_table.upsert(cog.id, _normalize_namespaced_values(cog))
         self._neighbor_indexes.clear()
+        self._segment_orders.clear()
+        self._candidate_generators.clear()
         if reset_policies:
             self.graph_policies = {}
 
@@ -343,12 +953,63 @@ class CogSystem:
     def snapshot_to_dict(snapshot: Snapshot) -> dict[str, Any]:
         return asdict(snapshot)
 
+    def _score_pairs(
+        self,
+        strategy: SimilarityStrategy,
+        sources: list[Cog],
+        targets: list[Cog],
+        executor: Executor | ScoringPool | None = None,
+        include_vectors: bool = True,
+    ) -> list[ScoreEntry]:
+        if executor is None and len(sources) * len(targets) >= self.parallel_min_pairs:
+            executor = self.scoring_executor
+        if isinstance(executor, ScoringPool):
+            shards = self.parallel_shards or (os.cpu_count() or 1) * 4
+            return executor.score_pairs(sources, targets, shards, include_vectors)
+        if executor is not None:
+            shards = self.parallel_shards or (os.cpu_count() or 1) * 4
+            return score_pairs_parallel(strategy, sources, targets, executor, shards, include_vectors)
+        return score_pairs(strategy, sources, targets, self.feature_table, include_vectors)
+
+    def _score_rows(
+        self,
+        strategy: SimilarityStrategy,
+        sources: list[Cog],
+        targets_by_source: list[list[Cog]],
+        executor: Executor | ScoringPool | None = None,
+        include_vectors: bool = True,
+    ) -> list[ScoreEntry]:
+        pairs = sum(len(targets) for targets in targets_by_source)
+        if executor is None and pairs >= self.parallel_min_pairs:
+            executor = self.scoring_executor
+        if isinstance(executor, ScoringPool):
+            shards = self.parallel_shards or (os.cpu_count() or 1) * 4
+            return executor.score_rows(sources, targets_by_source, shards, include_vectors)
+        if executor is not None:
+            shards = self.parallel_shards or (os.cpu_count() or 1) * 4
+            return score_rows_parallel(strategy, sources, targets_by_source, executor, shards, include_vectors)
+        return score_rows(strategy, sources, targets_by_source, self.feature_table, include_vectors)
+
+    def _score_both_ways(
+        self,
+        strategy: SimilarityStrategy,
+        sources: list[Cog],
+        targets: list[Cog],
+        include_vectors: bool = True,
+    ) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+        if self.scoring_executor is not None and len(sources) * len(targets) >= self.parallel_min_pairs:
+            return (
+                self._score_pairs(strategy, sources, targets, include_vectors=include_vectors),
+                self._score_pairs(strategy, targets, sources, include_vectors=include_vectors),
+            )
+        return score_pairs_both_ways(strategy, sources, targets, self.feature_table, include_vectors)
+
     @staticmethod
-    def _score_or_neg_inf(index: NeighborIndex, from_cog_id: str, to_cog_id: str) -> float:
-        for neighbor in index.neighbors(from_cog_id):
-            if neighbor.to_cog_id == to_cog_id:
-                return neighbor.score
-        return float("-inf")
+    def _group_rows(entries: Iterable[ScoreEntry]) -> dict[str, list[ScoreEntry]]:
+        rows: dict[str, list[ScoreEntry]] = {}
+        for entry in entries:
+            rows.setdefault(entry.from_cog_id, []).append(entry)
+        return rows
 
     @staticmethod
     def _normalize_feature_techniques(
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
+from ..core.composition import compose_cog
 from ..core.iteration import IterationEngine
 from ..core.models import Cog, CogScoring, LineageOperation
 from ..core.render import AsciiRenderer
@@ -274,36 +275,8 @@ class ICMMCPServer:
             raise ValueError(f"New cog id already exists: {new_cog_id}")
 
         source_cogs = [runtime.system.cogs[cog_id] for cog_id in cog_ids]
-        unique_themes: list[str] = []
-        for cog in source_cogs:
-            if cog.theme not in unique_themes:
-                unique_themes.append(cog.theme)
-        theme = str(payload.get("theme", " + ".join(unique_themes)))
-        content = " ".join([cog.content for cog in source_cogs if cog.content.strip()])
-        if not content:
-            content = " ".join(unique_themes)
-
-        component_ids: list[str] = []
-        for cog in source_cogs:
-            for component_id in cog.component_ids:
-                if component_id not in component_ids:
-                    component_ids.append(component_id)
-
-        directional_bias_values = [float(cog.features.get("directional_bias", 0.0)) for cog in source_cogs]
-        directional_bias = sum(directional_bias_values) / max(len(directional_bias_values), 1)
-        inherited_techniques = deepcopy(source_cogs[0].scoring.feature_techniques)
-
-        new_cog = Cog(
-            id=new_cog_id,
-            theme=theme,
-            breadth=0.0,
-            depth=0.0,
-            volume=0.0,
-            content=content,
-            component_ids=component_ids,
-            features={"directional_bias": directional_bias},
-            scoring=CogScoring(feature_techniques=inherited_techniques),
-        )
+        theme = str(payload["theme"]) if "theme" in payload else None
+        new_cog = compose_cog(new_cog_id, source_cogs, theme=theme)
         runtime.system.add_cog(new_cog)
         self._attach_to_graph_if_requested(runtime, new_cog_id, payload)
 
@@ -322,8 +295,8 @@ class ICMMCPServer:
         return {
             "new_cog_id": new_cog_id,
             "source_cog_ids": cog_ids,
-            "theme": theme,
-            "component_count": len(component_ids),
+            "theme": new_cog.theme,
+            "component_count": len(new_cog.component_ids),
         }
 
     def _tool_cog_split(self, runtime: WorkspaceRuntime, payload: dict[str, Any]) -> dict[str, Any]:
@@ -349,26 +322,28 @@ class ICMMCPServer:
         if not tokens:
             raise ValueError("No split tokens were produced from source cog.")
 
+        new_cog_ids = [f"{prefix}_{index}" for index in range(1, len(tokens) + 1)]
+        existing = [cog_id for cog_id in new_cog_ids if cog_id in runtime.system.cogs]
+        if existing:
+            raise ValueError(f"Split target id already exists: {existing[0]}")
+
         created_ids: list[str] = []
-        for index, token in enumerate(tokens, start=1):
-            new_cog_id = f"{prefix}_{index}"
-            if new_cog_id in runtime.system.cogs:
-                raise ValueError(f"Split target id already exists: {new_cog_id}")
-
-            child = Cog(
-                id=new_cog_id,
-                theme=source.theme,
-                breadth=0.0,
-                depth=0.0,
-                volume=0.0,
-                content=token,
-                component_ids=[],
-                features={"directional_bias": float(source.features.get("directional_bias", 0.0))},
-                scoring=CogScoring(feature_techniques=deepcopy(source.scoring.feature_techniques)),
-            )
-            runtime.system.add_cog(child)
-            self._attach_to_graph_if_requested(runtime, new_cog_id, payload)
-            created_ids.append(new_cog_id)
+        with runtime.system.batch():
+            for new_cog_id, token in zip(new_cog_ids, tokens):
+                child = Cog(
+                    id=new_cog_id,
+                    theme=source.theme,
+                    breadth=0.0,
+                    depth=0.0,
+                    volume=0.0,
+                    content=token,
+                    component_ids=[],
+                    features={"directional_bias": float(source.features.get("directional_bias", 0.0))},
+                    scoring=CogScoring(feature_techniques=deepcopy(source.scoring.feature_techniques)),
+                )
+                runtime.system.add_cog(child)
+                self._attach_to_graph_if_requested(runtime, new_cog_id, payload)
+                created_ids.append(new_cog_id)
 
         runtime.system.lineage.append(
             LineageOperation(
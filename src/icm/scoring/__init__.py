@@ -1,31 +1,43 @@
+from .candidates import CandidateGenerator, ProjectionCandidateGenerator
 from .features import (
     AlphabetPolarBreadthTechnique,
+    BatchFeatureTechnique,
     CallableFeatureTechnique,
     FeatureTechnique,
     LetterDepthTechnique,
     LetterVolumeTechnique,
+    ProfiledFeatureTechnique,
+    TextProfile,
 )
-from .plugins import import_plugin_module, load_feature_techniques
+from .plugins import import_plugin_module, load_feature_techniques, supports_calculate_many
 from .presets import (
     StrategyPreset,
     WEIGHTED_STRATEGY_PRESETS,
     build_weighted_strategy_from_preset,
     list_weighted_strategy_presets,
 )
+from .scheduler import FeatureScheduler
 from .strategies import SimilarityStrategy, WeightedFeatureStrategy
 
 __all__ = [
     "AlphabetPolarBreadthTechnique",
+    "BatchFeatureTechnique",
     "CallableFeatureTechnique",
+    "CandidateGenerator",
+    "FeatureScheduler",
     "FeatureTechnique",
     "LetterDepthTechnique",
     "LetterVolumeTechnique",
+    "ProfiledFeatureTechnique",
+    "ProjectionCandidateGenerator",
     "SimilarityStrategy",
     "StrategyPreset",
+    "TextProfile",
     "WEIGHTED_STRATEGY_PRESETS",
     "WeightedFeatureStrategy",
     "build_weighted_strategy_from_preset",
     "import_plugin_module",
     "list_weighted_strategy_presets",
     "load_feature_techniques",
+    "supports_calculate_many",
 ]
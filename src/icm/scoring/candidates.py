@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Protocol
+
+from ..core.models import Cog
+from .strategies import SimilarityStrategy, _normalize_namespaced_values, _relative_similarity
+
+
+class CandidateGenerator(Protocol):
+    def candidates(self, cogs: list[Cog], strategy: SimilarityStrategy) -> dict[str, list[str]]:
+        ...
+
+
+@dataclass
+class ProjectionCandidateGenerator:
+    """Random-projection candidate generation with optional theme blocking.
+
+    Feature vectors are log-scaled (relative similarity is scale-relative) and projected
+    onto a few seeded random directions. Cogs within ``window`` positions (default
+    ``max_candidates // 2``) of a source along any projection, globally or inside the
+    source's theme block, form its pool; the pool is ranked by a cheap proxy of the
+    weighted score and the best ``max_candidates`` targets are kept.
+    """
+
+    max_candidates: int = 32
+    projections: int = 4
+    window: int | None = None
+    theme_blocking: bool = True
+    seed: int = 0
+
+    def candidates(self, cogs: list[Cog], strategy: SimilarityStrategy) -> dict[str, list[str]]:
+        if self.max_candidates < 1:
+            raise ValueError("max_candidates must be at least 1.")
+        normalized = [_normalize_namespaced_values(cog) for cog in cogs]
+        columns = sorted(
+            {
+                (namespace, feature_name)
+                for values in normalized
+                for namespace, feature_values in values.items()
+                for feature_name in feature_values
+            }
+        )
+        weights = [self._column_weight(strategy, namespace, feature_name) for namespace, feature_name in columns]
+        raw = [
+            [values.get(namespace, {}).get(feature_name) for namespace, feature_name in columns]
+            for values in normalized
+        ]
+        scaled = [
+            [
+                0.0 if value is None else math.copysign(math.log1p(abs(value)), value) * weight
+                for value, weight in zip(row, weights)
+            ]
+            for row in raw
+        ]
+
+        rng = random.Random(self.seed)
+        directions = [[rng.gauss(0.0, 1.0) for _ in columns] for _ in range(self.projections)]
+        keys = [[sum(a * b for a, b in zip(row, direction)) for direction in directions] for row in scaled]
+
+        blocks: list[list[int]] = [list(range(len(cogs)))]
+        if self.theme_blocking:
+            by_theme: dict[str, list[int]] = {}
+            for row, cog in enumerate(cogs):
+                by_theme.setdefault(cog.theme, []).append(row)
+            blocks.extend(by_theme.values())
+
+        window = self.window if self.window is not None else max(1, self.max_candidates // 2)
+        pools: list[set[int]] = [set() for _ in cogs]
+        for block in blocks:
+            for projection in range(self.projections):
+                order = sorted(block, key=lambda row: (keys[row][projection], cogs[row].id))
+                for pos, row in enumerate(order):
+                    pools[row].update(order[max(0, pos - window) : pos + window + 1])
+
+        theme_weight = float(getattr(strategy, "theme_weight", 0.0))
+        bias_feature = getattr(strategy, "directional_bias_feature", None)
+        result: dict[str, list[str]] = {}
+        for row, cog in enumerate(cogs):
+            ranked: list[tuple[float, str]] = []
+            for other in pools[row]:
+                target = cogs[other]
+                if target.id == cog.id:
+                    continue
+                proxy = theme_weight * (1.0 if target.theme == cog.theme else 0.0)
+                proxy += (1.0 - theme_weight) * self._feature_proxy(raw[row], raw[other], weights)
+                if bias_feature is not None:
+                    proxy -= float(target.features.get(bias_feature, 0.0)) * 0.05
+                ranked.append((-proxy, target.id))
+            ranked.sort()
+            result[cog.id] = [target_id for _, target_id in ranked[: self.max_candidates]]
+        return result
+
+    @staticmethod
+    def _feature_proxy(left: list[float | None], right: list[float | None], weights: list[float]) -> float:
+        total = 0.0
+        total_weight = 0.0
+        for left_value, right_value, weight in zip(left, right, weights):
+            if left_value is None or right_value is None:
+                continue
+            total += _relative_similarity(left_value, right_value) * weight
+            total_weight += weight
+        return total / total_weight if total_weight > 0.0 else 0.0
+
+    @staticmethod
+    def _column_weight(strategy: SimilarityStrategy, namespace: str, feature_name: str) -> float:
+        feature_weight = getattr(strategy, "_feature_weight", None)
+        namespace_weights = getattr(strategy, "namespace_weights", {})
+        weight = feature_weight(namespace, feature_name) if callable(feature_weight) else 1.0
+        return float(weight) * float(namespace_weights.get(namespace, 1.0))
@@ -1,15 +1,61 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Callable, Protocol
+from typing import Callable, Protocol, Sequence
 
 from ..core.models import Cog
 
+_VOWELS = frozenset("aeiou")
+
+# Declared through a technique's optional ``concurrency`` attribute:
+#   "serial"        run on the calling thread (default)
+#   "thread_safe"   may run on a worker thread alongside other techniques, one task per technique
+#   "releases_gil"  thread-safe and spends its time outside the GIL; chunked across worker threads
+#   "process"       picklable and CPU-bound in Python; chunked across worker processes
+CONCURRENCY_MODES = ("serial", "thread_safe", "releases_gil", "process")
+
 
 def _letters_only(text: str) -> list[str]:
     return [char.lower() for char in text if char.isalpha()]
 
 
+@dataclass(frozen=True)
+class TextProfile:
+    """Letter statistics of a cog's text (``content``, or ``theme`` when empty)."""
+
+    text: str
+    letters: tuple[str, ...]
+    counts: dict[str, int]
+    unique: frozenset[str]
+    vowel_count: int
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextProfile":
+        letters = tuple(_letters_only(text))
+        counts = dict(Counter(letters))
+        return cls(
+            text=text,
+            letters=letters,
+            counts=counts,
+            unique=frozenset(counts),
+            vowel_count=sum(count for char, count in counts.items() if char in _VOWELS),
+        )
+
+    @classmethod
+    def of(cls, cog: Cog) -> "TextProfile":
+        return cls.from_text(cog.content or cog.theme)
+
+
+def technique_concurrency(technique: object) -> str:
+    mode = getattr(technique, "concurrency", "serial")
+    if mode not in CONCURRENCY_MODES:
+        known = ", ".join(CONCURRENCY_MODES)
+        technique_id = getattr(technique, "id", "?")
+        raise ValueError(f"Unknown concurrency mode for technique {technique_id}: {mode}. Known modes: {known}")
+    return mode
+
+
 class FeatureTechnique(Protocol):
     id: str
     namespace: str
@@ -19,12 +65,35 @@ class FeatureTechnique(Protocol):
         ...
 
 
+class ProfiledFeatureTechnique(FeatureTechnique, Protocol):
+    """Technique that can read a shared ``TextProfile`` instead of re-scanning the text.
+
+    ``CogSystem`` builds one profile per cog text and calls ``calculate_with_profile``
+    on every technique that defines it; ``calculate`` remains the standalone entry point.
+    """
+
+    def calculate_with_profile(self, cog: Cog, profile: TextProfile) -> float:
+        ...
+
+
+class BatchFeatureTechnique(FeatureTechnique, Protocol):
+    """Technique that computes one value per cog for a whole batch in a single call.
+
+    ``calculate_many`` returns a float sequence (list, ``array``, NumPy array, ...)
+    aligned with ``cogs``; ``CogSystem.recompute_features`` prefers it over ``calculate``.
+    """
+
+    def calculate_many(self, cogs: list[Cog]) -> Sequence[float]:
+        ...
+
+
 @dataclass
 class CallableFeatureTechnique:
     id: str
     namespace: str
     feature_name: str
     calculator: Callable[[Cog], float]
+    concurrency: str = "serial"
 
     def calculate(self, cog: Cog) -> float:
         return float(self.calculator(cog))
@@ -37,12 +106,13 @@ class AlphabetPolarBreadthTechnique:
     feature_name: str = "breadth"
 
     def calculate(self, cog: Cog) -> float:
-        source = cog.content or cog.theme
-        letters = _letters_only(source)
-        if not letters:
+        return self.calculate_with_profile(cog, TextProfile.of(cog))
+
+    def calculate_with_profile(self, cog: Cog, profile: TextProfile) -> float:
+        if not profile.unique:
             return 0.0
-        min_value = min(ord(char) - ord("a") for char in letters)
-        max_value = max(ord(char) - ord("a") for char in letters)
+        min_value = min(ord(char) - ord("a") for char in profile.unique)
+        max_value = max(ord(char) - ord("a") for char in profile.unique)
         return float(max_value - min_value)
 
 
@@ -53,14 +123,12 @@ class LetterDepthTechnique:
     feature_name: str = "depth"
 
     def calculate(self, cog: Cog) -> float:
-        source = cog.content or cog.theme
-        letters = _letters_only(source)
-        if not letters:
+        return self.calculate_with_profile(cog, TextProfile.of(cog))
+
+    def calculate_with_profile(self, cog: Cog, profile: TextProfile) -> float:
+        if not profile.counts:
             return 0.0
-        counts: dict[str, int] = {}
-        for char in letters:
-            counts[char] = counts.get(char, 0) + 1
-        return float(max(counts.values()))
+        return float(max(profile.counts.values()))
 
 
 @dataclass
@@ -70,6 +138,7 @@ class LetterVolumeTechnique:
     feature_name: str = "volume"
 
     def calculate(self, cog: Cog) -> float:
-        source = cog.content or cog.theme
-        letters = _letters_only(source)
-        return float(len(letters))
+        return self.calculate_with_profile(cog, TextProfile.of(cog))
+
+    def calculate_with_profile(self, cog: Cog, profile: TextProfile) -> float:
+        return float(len(profile.letters))
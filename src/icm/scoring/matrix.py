@@ -0,0 +1,585 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..core.models import Cog, ScoreEntry
+from .plan import LEGACY_FEATURES
+from .strategies import _normalize_namespaced_values
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ..core.feature_table import FeatureTable
+    from .strategies import WeightedFeatureStrategy
+
+
+# Python 3.12 switched float ``sum()`` to Neumaier summation. The matrix path replays
+# whichever algorithm the scalar path runs on so both produce identical floats.
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+_BLOCK_ELEMENTS = 1 << 18
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class _RunningSum:
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.total = np.zeros(shape)
+        self.compensation = np.zeros(shape) if _COMPENSATED_SUM else None
+
+    def add(self, values: Any, mask: Any) -> None:
+        if self.compensation is None:
+            self.total = np.where(mask, self.total + values, self.total)
+            return
+        summed = self.total + values
+        low = np.where(
+            np.abs(self.total) >= np.abs(values),
+            (self.total - summed) + values,
+            (values - summed) + self.total,
+        )
+        self.compensation = np.where(mask, self.compensation + low, self.compensation)
+        self.total = np.where(mask, summed, self.total)
+
+    def result(self) -> Any:
+        if self.compensation is None:
+            return self.total
+        compensation = self.compensation
+        return np.where(
+            (compensation != 0.0) & np.isfinite(compensation),
+            self.total + compensation,
+            self.total,
+        )
+
+
+class _WeightedAverage:
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.weights = _RunningSum(shape)
+        self.values = _RunningSum(shape)
+        self.count = np.zeros(shape, dtype=bool)
+
+    def add(self, value: Any, weight: float, mask: Any) -> None:
+        self.weights.add(weight, mask)
+        self.values.add(value * weight, mask)
+        self.count |= mask
+
+    def result(self) -> Any:
+        total_weight = self.weights.result()
+        usable = self.count & ~(total_weight <= 0.0)
+        return np.where(usable, self.values.result() / np.where(usable, total_weight, 1.0), 0.0)
+
+
+def _clamp_01(values: Any) -> Any:
+    return np.where(values < 0.0, 0.0, np.where(values > 1.0, 1.0, values))
+
+
+def _relative_similarity(left: Any, right: Any) -> Any:
+    denom = np.maximum(np.maximum(np.abs(left), np.abs(right)), 1.0)
+    return _clamp_01(1.0 - (np.abs(left - right) / denom))
+
+
+class _PackedCogs:
+    def __init__(
+        self,
+        cogs: list[Cog],
+        namespace_present: Any,
+        present: Any,
+        values: Any,
+        themes: dict[str, int],
+        signatures: dict[tuple[int, int], int],
+        strategy: "WeightedFeatureStrategy",
+    ) -> None:
+        self.namespace_present = namespace_present
+        self.present = present
+        self.values = values
+        self.themes = np.array([themes.setdefault(cog.theme, len(themes)) for cog in cogs])
+        self.breadth = np.array([float(cog.breadth) for cog in cogs])
+        self.depth = np.array([float(cog.depth) for cog in cogs])
+        self.volume = np.array([float(cog.volume) for cog in cogs])
+        self.bias = np.array(
+            [float(cog.features.get(strategy.directional_bias_feature, 0.0)) for cog in cogs]
+        )
+        self.extras = [
+            np.array([float(cog.features.get(feature, 0.0)) for cog in cogs])
+            for feature in strategy.extra_feature_weights
+        ]
+
+        self.namespace_bits = [_bits(row) for row in namespace_present]
+        self.column_bits = [_bits(row) for row in present]
+        self.signatures = [
+            signatures.setdefault(bits, len(signatures)) for bits in zip(self.namespace_bits, self.column_bits)
+        ]
+
+
+def _bits(row: Any) -> int:
+    return int.from_bytes(np.packbits(row, bitorder="little").tobytes(), "little")
+
+
+def _pack_normalized(
+    groups: list[list[Cog]],
+) -> tuple[list[str], list[tuple[str, str]], list[tuple[Any, Any, Any]]]:
+    normalized = [[_normalize_namespaced_values(cog) for cog in cogs] for cogs in groups]
+    namespaces = sorted({namespace for group in normalized for values in group for namespace in values})
+    columns = sorted(
+        {
+            (namespace, feature_name)
+            for group in normalized
+            for values in group
+            for namespace, feature_values in values.items()
+            for feature_name in feature_values
+        }
+    )
+    namespace_pos = {namespace: pos for pos, namespace in enumerate(namespaces)}
+    column_pos = {column: pos for pos, column in enumerate(columns)}
+
+    arrays: list[tuple[Any, Any, Any]] = []
+    for group in normalized:
+        namespace_present = np.zeros((len(group), len(namespaces)), dtype=bool)
+        present = np.zeros((len(group), len(columns)), dtype=bool)
+        values = np.zeros((len(group), len(columns)))
+        for row, cog_values in enumerate(group):
+            for namespace, feature_values in cog_values.items():
+                namespace_present[row, namespace_pos[namespace]] = True
+                for feature_name, value in feature_values.items():
+                    pos = column_pos[(namespace, feature_name)]
+                    present[row, pos] = True
+                    values[row, pos] = value
+        arrays.append((namespace_present, present, values))
+    return namespaces, columns, arrays
+
+
+def _pack_table(
+    table: "FeatureTable",
+    groups: list[list[Cog]],
+) -> tuple[list[str], list[tuple[str, str]], list[tuple[Any, Any, Any]]]:
+    rows = [np.array([table.row_of[cog.id] for cog in cogs], dtype=np.intp) for cogs in groups]
+    namespaces: list[str] = []
+    namespace_masks: list[list[Any]] = [[] for _ in groups]
+    for namespace in sorted(table.namespaces):
+        mask = np.frombuffer(table.namespaces[namespace], dtype=bool)
+        picked = [mask[group_rows] for group_rows in rows]
+        if any(item.any() for item in picked):
+            namespaces.append(namespace)
+            for group_masks, item in zip(namespace_masks, picked):
+                group_masks.append(item)
+
+    columns: list[tuple[str, str]] = []
+    column_masks: list[list[Any]] = [[] for _ in groups]
+    column_values: list[list[Any]] = [[] for _ in groups]
+    for key in sorted(table.columns):
+        mask = np.frombuffer(table.present[key], dtype=bool)
+        picked = [mask[group_rows] for group_rows in rows]
+        if not any(item.any() for item in picked):
+            continue
+        columns.append(key)
+        data = np.frombuffer(table.columns[key], dtype=np.float64)
+        for pos, group_rows in enumerate(rows):
+            column_masks[pos].append(picked[pos])
+            column_values[pos].append(data[group_rows])
+
+    arrays: list[tuple[Any, Any, Any]] = []
+    for pos, group in enumerate(groups):
+        size = (len(group), 0)
+        arrays.append(
+            (
+                np.stack(namespace_masks[pos], axis=1) if namespaces else np.zeros(size, dtype=bool),
+                np.stack(column_masks[pos], axis=1) if columns else np.zeros(size, dtype=bool),
+                np.stack(column_values[pos], axis=1) if columns else np.zeros(size),
+            )
+        )
+    return namespaces, columns, arrays
+
+
+def weighted_score_matrix(
+    strategy: "WeightedFeatureStrategy",
+    sources: list[Cog],
+    targets: list[Cog] | None = None,
+    feature_table: "FeatureTable | None" = None,
+    include_vectors: bool = True,
+) -> list[ScoreEntry]:
+    """Score every (source, target) pair with distinct ids as whole-array operations.
+
+    Entries come back in row-major order and match ``strategy.score`` bit for bit,
+    including the explanation vector and its key order. With ``include_vectors=False``
+    entries carry empty vectors and the per-pair vector assembly is skipped. When
+    ``targets`` is ``sources`` only the upper triangle is evaluated and the lower one
+    is mirrored from it.
+    """
+    targets = sources if targets is None else targets
+    forward, _ = _score_blocks(strategy, sources, targets, feature_table, include_vectors, reverse=False)
+    return forward
+
+
+def weighted_score_both_ways(
+    strategy: "WeightedFeatureStrategy",
+    sources: list[Cog],
+    targets: list[Cog],
+    feature_table: "FeatureTable | None" = None,
+    include_vectors: bool = True,
+) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+    """Score sources x targets and targets x sources from one symmetric evaluation.
+
+    Returns the forward entries row-major over ``sources`` and the reverse entries
+    row-major over ``targets``; only the directional term is evaluated twice.
+    """
+    if targets is sources:
+        forward = weighted_score_matrix(strategy, sources, None, feature_table, include_vectors)
+        return forward, list(forward)
+    return _score_blocks(strategy, sources, targets, feature_table, include_vectors, reverse=True)
+
+
+def weighted_score_rows(
+    strategy: "WeightedFeatureStrategy",
+    sources: list[Cog],
+    targets_by_source: list[list[Cog]],
+    feature_table: "FeatureTable | None" = None,
+    include_vectors: bool = True,
+) -> list[ScoreEntry]:
+    """Score each source against its own target list, row-major, skipping same-id pairs.
+
+    The distinct targets are packed once and only the listed pairs are evaluated, as
+    flat gathered arrays rather than a sources x targets grid. Entries match
+    ``strategy.score`` bit for bit.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is not installed. Install package 'numpy' for matrix scoring.")
+    positions: dict[str, int] = {}
+    targets: list[Cog] = []
+    source_index: list[int] = []
+    target_index: list[int] = []
+    for source_row, (source, row_targets) in enumerate(zip(sources, targets_by_source)):
+        for target in row_targets:
+            if target.id == source.id:
+                continue
+            pos = positions.get(target.id)
+            if pos is None:
+                pos = positions[target.id] = len(targets)
+                targets.append(target)
+            source_index.append(source_row)
+            target_index.append(pos)
+    if not source_index:
+        return []
+
+    groups = [sources, targets]
+    if feature_table is not None and all(cog.id in feature_table for group in groups for cog in group):
+        namespaces, columns, arrays = _pack_table(feature_table, groups)
+    else:
+        namespaces, columns, arrays = _pack_normalized(groups)
+    themes: dict[str, int] = {}
+    signatures: dict[tuple[int, int], int] = {}
+    source_pack = _PackedCogs(sources, *arrays[0], themes, signatures, strategy)
+    target_pack = _PackedCogs(targets, *arrays[1], themes, signatures, strategy)
+
+    plan = strategy.compile(namespaces, columns)
+    slots = _SlotLayout(strategy, namespaces, columns)
+    layout_for = _layout_cache(strategy, plan, slots, source_pack, target_pack)
+
+    entries: list[ScoreEntry] = []
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for start in range(0, len(source_index), _BLOCK_ELEMENTS):
+            pair_sources = source_index[start : start + _BLOCK_ELEMENTS]
+            pair_targets = target_index[start : start + _BLOCK_ELEMENTS]
+            source_rows = np.array(pair_sources, dtype=np.intp)
+            target_rows = np.array(pair_targets, dtype=np.intp)
+            shape = (len(pair_sources),)
+            base_score, directional, any_feature, high, low, values_by_slot = _evaluate(
+                strategy,
+                plan,
+                slots,
+                source_pack,
+                target_pack,
+                lambda values: values[source_rows],
+                lambda values: values[target_rows],
+                shape,
+            )
+            final_scores = _clamp_01(base_score + directional).tolist()
+            variances = np.where(any_feature, high - low, 0.0).tolist()
+            slot_values = []
+            if include_vectors:
+                slot_values = [
+                    np.broadcast_to(values, shape).tolist() if values is not None else None
+                    for values in values_by_slot
+                ]
+            for pair, (source_row, target_row) in enumerate(zip(pair_sources, pair_targets)):
+                vector: dict[str, float] = {}
+                if include_vectors:
+                    vector = {key: slot_values[slot][pair] for key, slot in layout_for(source_row, target_row)}
+                entries.append(
+                    ScoreEntry(
+                        from_cog_id=sources[source_row].id,
+                        to_cog_id=targets[target_row].id,
+                        score=final_scores[pair],
+                        vector=vector,
+                        variance=variances[pair],
+                        strategy_id=strategy.id,
+                    )
+                )
+    return entries
+
+
+def _score_blocks(
+    strategy: "WeightedFeatureStrategy",
+    sources: list[Cog],
+    targets: list[Cog],
+    feature_table: "FeatureTable | None",
+    include_vectors: bool,
+    reverse: bool,
+) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+    if np is None:
+        raise RuntimeError("NumPy is not installed. Install package 'numpy' for matrix scoring.")
+    if not sources or not targets:
+        return [], []
+
+    symmetric = targets is sources
+    groups = [sources] if targets is sources else [sources, targets]
+    if feature_table is not None and all(cog.id in feature_table for group in groups for cog in group):
+        namespaces, columns, arrays = _pack_table(feature_table, groups)
+    else:
+        namespaces, columns, arrays = _pack_normalized(groups)
+    themes: dict[str, int] = {}
+    signatures: dict[tuple[int, int], int] = {}
+    source_pack = _PackedCogs(sources, *arrays[0], themes, signatures, strategy)
+    target_pack = (
+        source_pack if targets is sources else _PackedCogs(targets, *arrays[1], themes, signatures, strategy)
+    )
+
+    plan = strategy.compile(namespaces, columns)
+    slots = _SlotLayout(strategy, namespaces, columns)
+    layout_for = _layout_cache(strategy, plan, slots, source_pack, target_pack)
+
+    # Everything but the directional term is symmetric, so a mirrored pair reuses the
+    # forward evaluation. In symmetric mode each row block only covers columns from its
+    # first row onward, and lower-triangle entries arrive from earlier rows.
+    forward_rows: list[list[ScoreEntry]] = [[] for _ in sources]
+    if symmetric:
+        reverse_rows: list[list[ScoreEntry]] | None = forward_rows
+    else:
+        reverse_rows = [[] for _ in targets] if reverse else None
+    block = max(1, _BLOCK_ELEMENTS // len(targets))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for start in range(0, len(sources), block):
+            rows = slice(start, min(start + block, len(sources)))
+            cols = slice(start if symmetric else 0, len(targets))
+            shape = (rows.stop - rows.start, cols.stop - cols.start)
+            base_score, directional, any_feature, high, low, values_by_slot = _evaluate(
+                strategy,
+                plan,
+                slots,
+                source_pack,
+                target_pack,
+                lambda values: values[rows, None],
+                lambda values: values[None, cols],
+                shape,
+            )
+            final_scores = _clamp_01(base_score + directional).tolist()
+            variances = np.where(any_feature, high - low, 0.0).tolist()
+            if reverse_rows is not None:
+                reverse_directional = (target_pack.bias[None, cols] - source_pack.bias[rows, None]) * 0.05
+                reverse_scores = _clamp_01(base_score + reverse_directional).tolist()
+                reverse_adjustments = np.broadcast_to(reverse_directional, shape).tolist()
+
+            slot_rows = []
+            if include_vectors:
+                slot_rows = [
+                    np.broadcast_to(values, shape).tolist() if values is not None else None
+                    for values in values_by_slot
+                ]
+            for offset in range(shape[0]):
+                source_row = rows.start + offset
+                source = sources[source_row]
+                row_slots = [values[offset] if values is not None else None for values in slot_rows]
+                out_row = forward_rows[source_row]
+                first = source_row + 1 - cols.start if symmetric else 0
+                for column in range(first, shape[1]):
+                    target_row = cols.start + column
+                    target = targets[target_row]
+                    if target.id == source.id:
+                        continue
+                    vector: dict[str, float] = {}
+                    if include_vectors:
+                        vector = {
+                            key: row_slots[slot][column]
+                            for key, slot in layout_for(source_row, target_row)
+                        }
+                    variance = variances[offset][column]
+                    out_row.append(
+                        ScoreEntry(
+                            from_cog_id=source.id,
+                            to_cog_id=target.id,
+                            score=final_scores[offset][column],
+                            vector=vector,
+                            variance=variance,
+                            strategy_id=strategy.id,
+                        )
+                    )
+                    if reverse_rows is None:
+                        continue
+                    adjustment = reverse_adjustments[offset][column]
+                    if include_vectors:
+                        vector = dict(vector)
+                        vector["directional_adjustment"] = adjustment
+                    reverse_rows[target_row].append(
+                        ScoreEntry(
+                            from_cog_id=target.id,
+                            to_cog_id=source.id,
+                            score=reverse_scores[offset][column],
+                            vector=vector,
+                            variance=variance,
+                            strategy_id=strategy.id,
+                        )
+                    )
+
+    forward = [entry for row in forward_rows for entry in row]
+    if reverse_rows is None or symmetric:
+        return forward, []
+    return forward, [entry for row in reverse_rows for entry in row]
+
+
+class _SlotLayout:
+    """Output slot offsets: theme, one per column, one per namespace, legacy core trio, extras, directional."""
+
+    def __init__(
+        self,
+        strategy: "WeightedFeatureStrategy",
+        namespaces: list[str],
+        columns: list[tuple[str, str]],
+    ) -> None:
+        self.namespace_count = len(namespaces)
+        self.column = 1
+        self.namespace = self.column + len(columns)
+        self.legacy = self.namespace + len(namespaces)
+        self.extra = self.legacy + 3
+        self.directional = self.extra + len(strategy.extra_feature_weights)
+
+
+def _layout_cache(
+    strategy: "WeightedFeatureStrategy",
+    plan: Any,
+    slots: _SlotLayout,
+    source_pack: _PackedCogs,
+    target_pack: _PackedCogs,
+) -> Callable[[int, int], list[tuple[str, int]]]:
+    layouts: dict[tuple[int, int], list[tuple[str, int]]] = {}
+
+    def layout_for(source_row: int, target_row: int) -> list[tuple[str, int]]:
+        key = (source_pack.signatures[source_row], target_pack.signatures[target_row])
+        cached = layouts.get(key)
+        if cached is not None:
+            return cached
+        groups = plan.groups(
+            source_pack.namespace_bits[source_row],
+            target_pack.namespace_bits[target_row],
+            source_pack.column_bits[source_row],
+            target_pack.column_bits[target_row],
+        )
+        layout: list[tuple[str, int]] = [("theme_match", 0)]
+        selected: set[int] = set()
+        for ns_pos, positions in groups:
+            for pos in positions:
+                layout.append((plan.feature_keys[pos], slots.column + pos))
+            selected.update(positions)
+            layout.append((plan.namespace_keys[ns_pos], slots.namespace + ns_pos))
+        for offset, name in enumerate(LEGACY_FEATURES):
+            pos = plan.legacy_columns[offset]
+            if pos is not None and pos in selected:
+                layout.append((f"{name}_similarity", slots.column + pos))
+            else:
+                layout.append((f"{name}_similarity", slots.legacy + offset))
+        for offset, feature in enumerate(strategy.extra_feature_weights):
+            layout.append((f"feature:{feature}", slots.extra + offset))
+        layout.append(("directional_adjustment", slots.directional))
+        layouts[key] = layout
+        return layout
+
+    return layout_for
+
+
+def _evaluate(
+    strategy: "WeightedFeatureStrategy",
+    plan: Any,
+    slots: _SlotLayout,
+    source_pack: _PackedCogs,
+    target_pack: _PackedCogs,
+    source: Callable[[Any], Any],
+    target: Callable[[Any], Any],
+    shape: tuple[int, ...],
+) -> tuple[Any, Any, Any, Any, Any, list[Any]]:
+    """Evaluate the pairs selected by ``source``/``target`` (per-cog array -> pair array).
+
+    Returns the base score, directional term, feature mask, similarity range and the
+    per-slot values used for explanation vectors.
+    """
+    namespace_columns = plan.namespace_columns
+    feature_weights = plan.feature_weights
+    namespace_weights = plan.namespace_weights
+    aggregate_weights = plan.aggregate_weights
+    combine_namespaces = np.logical_and if plan.common_namespaces else np.logical_or
+    combine_features = np.logical_and if plan.common_features else np.logical_or
+
+    values_by_slot: list[Any] = [None] * (slots.directional + 1)
+    theme = (source(source_pack.themes) == target(target_pack.themes)).astype(float)
+    values_by_slot[0] = theme
+    any_feature = np.zeros(shape, dtype=bool)
+    high = np.full(shape, -np.inf)
+    low = np.full(shape, np.inf)
+    aggregate = _WeightedAverage(shape)
+    per_namespace = _WeightedAverage(shape)
+
+    for ns_pos in range(slots.namespace_count):
+        namespace_selected = combine_namespaces(
+            source(source_pack.namespace_present[:, ns_pos]),
+            target(target_pack.namespace_present[:, ns_pos]),
+        )
+        namespace_average = _WeightedAverage(shape)
+        namespace_weight = namespace_weights[ns_pos]
+        for pos in namespace_columns[ns_pos]:
+            selected = namespace_selected & combine_features(
+                source(source_pack.present[:, pos]),
+                target(target_pack.present[:, pos]),
+            )
+            similarity = _relative_similarity(
+                source(source_pack.values[:, pos]),
+                target(target_pack.values[:, pos]),
+            )
+            values_by_slot[slots.column + pos] = similarity
+            weight = feature_weights[pos]
+            namespace_average.add(similarity, weight, selected)
+            aggregate.add(similarity, aggregate_weights[pos], selected)
+            any_feature |= selected
+            high = np.where(selected, np.maximum(high, similarity), high)
+            low = np.where(selected, np.minimum(low, similarity), low)
+
+        namespace_score = namespace_average.result()
+        values_by_slot[slots.namespace + ns_pos] = namespace_score
+        per_namespace.add(namespace_score, namespace_weight, namespace_selected)
+
+    if strategy.feature_namespace_mode == "per_namespace":
+        feature_score = per_namespace.result()
+    else:
+        feature_score = aggregate.result()
+
+    for offset, name in enumerate(LEGACY_FEATURES):
+        values_by_slot[slots.legacy + offset] = _relative_similarity(
+            source(getattr(source_pack, name)),
+            target(getattr(target_pack, name)),
+        )
+
+    base_score = strategy.theme_weight * theme + ((1.0 - strategy.theme_weight) * feature_score)
+
+    weighted_extra: Any = 0.0
+    total_extra_weight = 0.0
+    for offset, weight in enumerate(strategy.extra_feature_weights.values()):
+        total_extra_weight += weight
+        similarity = _clamp_01(1.0 - np.abs(source(source_pack.extras[offset]) - target(target_pack.extras[offset])))
+        values_by_slot[slots.extra + offset] = similarity
+        weighted_extra = weighted_extra + weight * similarity
+    if total_extra_weight > 0:
+        base_score = (base_score + weighted_extra) / (1.0 + total_extra_weight)
+
+    directional = (source(source_pack.bias) - target(target_pack.bias)) * 0.05
+    values_by_slot[slots.directional] = directional
+    return base_score, directional, any_feature, high, low, values_by_slot
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+from ..core.feature_table import FeatureTable
+from ..core.models import Cog, CogScoring, ScoreEntry
+from .strategies import SimilarityStrategy, _normalize_namespaced_values
+
+CompactCog = tuple[str, str, float, float, float, dict[str, float], dict[str, dict[str, float]]]
+CompactEntry = tuple[str, str, float, float, dict[str, float], str]
+
+# Strategy and restored population installed once per ``ScoringPool`` worker process.
+_WORKER: dict[str, Any] = {}
+
+
+def score_pairs(
+    strategy: SimilarityStrategy,
+    sources: list[Cog],
+    targets: list[Cog],
+    feature_table: FeatureTable | None = None,
+    include_vectors: bool = True,
+) -> list[ScoreEntry]:
+    """Score sources x targets (distinct ids only) in row-major order."""
+    score_matrix = getattr(strategy, "score_matrix", None)
+    if callable(score_matrix):
+        return list(
+            score_matrix(sources, targets, feature_table=feature_table, include_vectors=include_vectors)
+        )
+    entries = [
+        strategy.score(source, target)
+        for source in sources
+        for target in targets
+        if source.id != target.id
+    ]
+    if not include_vectors:
+        entries = [replace(entry, vector={}) for entry in entries]
+    return entries
+
+
+def score_pairs_both_ways(
+    strategy: SimilarityStrategy,
+    sources: list[Cog],
+    targets: list[Cog],
+    feature_table: FeatureTable | None = None,
+    include_vectors: bool = True,
+) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+    """Score sources x targets and targets x sources (each row-major, distinct ids only).
+
+    Strategies with a symmetric core expose ``score_both_ways`` and evaluate each pair
+    once; others are scored in both directions separately.
+    """
+    score_both_ways = getattr(strategy, "score_both_ways", None)
+    if callable(score_both_ways):
+        forward, backward = score_both_ways(
+            sources, targets, feature_table=feature_table, include_vectors=include_vectors
+        )
+        return list(forward), list(backward)
+    return (
+        score_pairs(strategy, sources, targets, feature_table, include_vectors),
+        score_pairs(strategy, targets, sources, feature_table, include_vectors),
+    )
+
+
+def score_rows(
+    strategy: SimilarityStrategy,
+    sources: list[Cog],
+    targets_by_source: list[list[Cog]],
+    feature_table: FeatureTable | None = None,
+    include_vectors: bool = True,
+) -> list[ScoreEntry]:
+    """Score each source against its own target list, row-major (distinct ids only)."""
+    rows = getattr(strategy, "score_rows", None)
+    if callable(rows):
+        return list(rows(sources, targets_by_source, feature_table=feature_table, include_vectors=include_vectors))
+    return [
+        entry
+        for source, targets in zip(sources, targets_by_source)
+        for entry in score_pairs(strategy, [source], targets, feature_table, include_vectors)
+    ]
+
+
+def score_pairs_parallel(
+    strategy: SimilarityStrategy,
+    sources: list[Cog],
+    targets: list[Cog],
+    executor: Executor,
+    shards: int,
+    include_vectors: bool = True,
+) -> list[ScoreEntry]:
+    """Shard ``score_pairs`` across an executor and merge shards in serial order.
+
+    Workers receive the pickled strategy config and compact cog tuples (ids, theme,
+    core scalars, ``features`` and normalized feature values) rather than full cogs,
+    so strategies that read other cog fields must be scored serially.
+    """
+    shards = max(1, shards)
+    compact_sources = [_compact(cog) for cog in sources]
+    compact_targets = compact_sources if targets is sources else [_compact(cog) for cog in targets]
+
+    if len(sources) >= len(targets):
+        step = -(-len(sources) // shards)
+        payloads = [
+            (strategy, compact_sources[start : start + step], compact_targets, include_vectors)
+            for start in range(0, len(sources), step)
+        ]
+        return [_expand(item) for chunk in executor.map(_score_shard, payloads) for item in chunk]
+
+    # Few sources (for example one rescored cog): shard the targets and regroup each row.
+    step = -(-len(targets) // shards)
+    payloads = [
+        (strategy, compact_sources, compact_targets[start : start + step], include_vectors)
+        for start in range(0, len(targets), step)
+    ]
+    rows: dict[str, list[ScoreEntry]] = {cog.id: [] for cog in sources}
+    for chunk in executor.map(_score_shard, payloads):
+        for item in chunk:
+            rows[item[0]].append(_expand(item))
+    return [entry for row in rows.values() for entry in row]
+
+
+def score_rows_parallel(
+    strategy: SimilarityStrategy,
+    sources: list[Cog],
+    targets_by_source: list[list[Cog]],
+    executor: Executor,
+    shards: int,
+    include_vectors: bool = True,
+) -> list[ScoreEntry]:
+    """Shard ``score_rows`` by source across an executor and merge shards in serial order.
+
+    Each shard carries compact copies of its own sources and of the distinct targets
+    its rows reference; the same field restrictions as ``score_pairs_parallel`` apply.
+    """
+    shards = max(1, shards)
+    compact: dict[str, CompactCog] = {}
+
+    def pack(cog: Cog) -> CompactCog:
+        item = compact.get(cog.id)
+        if item is None:
+            item = compact[cog.id] = _compact(cog)
+        return item
+
+    step = max(1, -(-len(sources) // shards))
+    payloads = []
+    for start in range(0, len(sources), step):
+        shard_rows = targets_by_source[start : start + step]
+        targets = {cog.id: pack(cog) for row in shard_rows for cog in row}
+        payloads.append(
+            (
+                strategy,
+                [pack(cog) for cog in sources[start : start + step]],
+                list(targets.values()),
+                [[cog.id for cog in row] for row in shard_rows],
+                include_vectors,
+            )
+        )
+    return [_expand(item) for chunk in executor.map(_score_rows_shard, payloads) for item in chunk]
+
+
+class ScoringPool:
+    """A process pool whose workers receive the strategy and population once, at start-up.
+
+    ``score_pairs_parallel`` pickles the strategy and compact targets into every shard;
+    here tasks carry only source and target ids (``None`` for the whole population), so
+    per-task traffic no longer grows with the population. Only cogs of the population
+    given to the constructor can be scored, with the same field restrictions as
+    ``score_pairs_parallel``.
+    """
+
+    def __init__(self, strategy: SimilarityStrategy, cogs: list[Cog], workers: int) -> None:
+        self.population = [cog.id for cog in cogs]
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_install_population,
+            initargs=(strategy, [_compact(cog) for cog in cogs]),
+        )
+
+    def __enter__(self) -> "ScoringPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown()
+
+    def score_pairs(
+        self,
+        sources: list[Cog],
+        targets: list[Cog],
+        shards: int,
+        include_vectors: bool = True,
+    ) -> list[ScoreEntry]:
+        """Same result as ``score_pairs_parallel`` for cogs of this pool's population."""
+        shards = max(1, shards)
+        source_ids = [cog.id for cog in sources]
+        target_ids = [cog.id for cog in targets]
+        whole = None if target_ids == self.population else target_ids
+        if len(sources) >= len(targets):
+            step = -(-len(sources) // shards)
+            payloads = [
+                (source_ids[start : start + step], whole, include_vectors)
+                for start in range(0, len(sources), step)
+            ]
+            return [_expand(item) for chunk in self.executor.map(_score_pool_shard, payloads) for item in chunk]
+
+        step = -(-len(targets) // shards)
+        payloads = [
+            (source_ids, target_ids[start : start + step], include_vectors) for start in range(0, len(targets), step)
+        ]
+        rows: dict[str, list[ScoreEntry]] = {cog_id: [] for cog_id in source_ids}
+        for chunk in self.executor.map(_score_pool_shard, payloads):
+            for item in chunk:
+                rows[item[0]].append(_expand(item))
+        return [entry for row in rows.values() for entry in row]
+
+    def score_rows(
+        self,
+        sources: list[Cog],
+        targets_by_source: list[list[Cog]],
+        shards: int,
+        include_vectors: bool = True,
+    ) -> list[ScoreEntry]:
+        """Same result as ``score_rows_parallel`` for cogs of this pool's population."""
+        step = max(1, -(-len(sources) // max(1, shards)))
+        payloads = [
+            (
+                [cog.id for cog in sources[start : start + step]],
+                [[cog.id for cog in row] for row in targets_by_source[start : start + step]],
+                include_vectors,
+            )
+            for start in range(0, len(sources), step)
+        ]
+        return [_expand(item) for chunk in self.executor.map(_score_pool_rows_shard, payloads) for item in chunk]
+
+
+def _compact(cog: Cog) -> CompactCog:
+    return (
+        cog.id,
+        cog.theme,
+        float(cog.breadth),
+        float(cog.depth),
+        float(cog.volume),
+        dict(cog.features),
+        _normalize_namespaced_values(cog),
+    )
+
+
+def _restore(item: CompactCog) -> Cog:
+    cog_id, theme, breadth, depth, volume, features, feature_values = item
+    return Cog(
+        id=cog_id,
+        theme=theme,
+        breadth=breadth,
+        depth=depth,
+        volume=volume,
+        features=features,
+        scoring=CogScoring(feature_values=feature_values),
+    )
+
+
+def _expand(item: CompactEntry) -> ScoreEntry:
+    from_cog_id, to_cog_id, score, variance, vector, strategy_id = item
+    return ScoreEntry(
+        from_cog_id=from_cog_id,
+        to_cog_id=to_cog_id,
+        score=score,
+        vector=vector,
+        variance=variance,
+        strategy_id=strategy_id,
+    )
+
+
+def _score_shard(payload: tuple[Any, list[CompactCog], list[CompactCog], bool]) -> list[CompactEntry]:
+    strategy, sources, targets, include_vectors = payload
+    restored_sources = [_restore(item) for item in sources]
+    restored_targets = restored_sources if targets is sources else [_restore(item) for item in targets]
+    return [
+        (entry.from_cog_id, entry.to_cog_id, entry.score, entry.variance, entry.vector, entry.strategy_id)
+        for entry in score_pairs(strategy, restored_sources, restored_targets, include_vectors=include_vectors)
+    ]
+
+
+def _score_rows_shard(
+    payload: tuple[Any, list[CompactCog], list[CompactCog], list[list[str]], bool],
+) -> list[CompactEntry]:
+    strategy, sources, targets, target_ids, include_vectors = payload
+    restored = {item[0]: _restore(item) for item in targets}
+    return [
+        (entry.from_cog_id, entry.to_cog_id, entry.score, entry.variance, entry.vector, entry.strategy_id)
+        for entry in score_rows(
+            strategy,
+            [_restore(item) for item in sources],
+            [[restored[cog_id] for cog_id in row] for row in target_ids],
+            include_vectors=include_vectors,
+        )
+    ]
+
+
+def _install_population(strategy: SimilarityStrategy, population: list[CompactCog]) -> None:
+    cogs = [_restore(item) for item in population]
+    table = FeatureTable()
+    for cog in cogs:
+        table.upsert(cog.id, cog.scoring.feature_values)
+    _WORKER["strategy"] = strategy
+    _WORKER["population"] = cogs
+    _WORKER["cogs"] = {cog.id: cog for cog in cogs}
+    _WORKER["feature_table"] = table
+
+
+def _score_pool_shard(payload: tuple[list[str], list[str] | None, bool]) -> list[CompactEntry]:
+    source_ids, target_ids, include_vectors = payload
+    cogs = _WORKER["cogs"]
+    targets = _WORKER["population"] if target_ids is None else [cogs[cog_id] for cog_id in target_ids]
+    return [
+        (entry.from_cog_id, entry.to_cog_id, entry.score, entry.variance, entry.vector, entry.strategy_id)
+        for entry in score_pairs(
+            _WORKER["strategy"],
+            [cogs[cog_id] for cog_id in source_ids],
+            targets,
+            _WORKER["feature_table"],
+            include_vectors,
+        )
+    ]
+
+
+def _score_pool_rows_shard(payload: tuple[list[str], list[list[str]], bool]) -> list[CompactEntry]:
+    source_ids, target_ids, include_vectors = payload
+    cogs = _WORKER["cogs"]
+    return [
+        (entry.from_cog_id, entry.to_cog_id, entry.score, entry.variance, entry.vector, entry.strategy_id)
+        for entry in score_rows(
+            _WORKER["strategy"],
+            [cogs[cog_id] for cog_id in source_ids],
+            [[cogs[cog_id] for cog_id in row] for row in target_ids],
+            _WORKER["feature_table"],
+            include_vectors,
+        )
+    ]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .strategies import WeightedFeatureStrategy
+
+
+PlanGroups = tuple[tuple[int, tuple[int, ...]], ...]
+PackedRow = tuple[int, int, list[float]]
+
+LEGACY_FEATURES = ("breadth", "depth", "volume")
+
+
+@dataclass
+class StrategyPlan:
+    """Weights, keys and layouts of a ``WeightedFeatureStrategy`` resolved for one schema.
+
+    ``columns`` are the sorted ``(namespace, feature)`` pairs of a cog population and
+    ``namespaces`` its sorted namespaces. Presence is carried as integer bitsets (bit
+    ``pos`` of a column or namespace), so a pair's selected features are one ``&``/``|``
+    per mask and the resulting per-namespace column groups are cached by mask pair.
+    """
+
+    key: tuple
+    namespaces: tuple[str, ...]
+    columns: tuple[tuple[str, str], ...]
+    namespace_columns: tuple[tuple[int, ...], ...]
+    feature_weights: tuple[float, ...]
+    namespace_weights: tuple[float, ...]
+    aggregate_weights: tuple[float, ...]
+    feature_keys: tuple[str, ...]
+    namespace_keys: tuple[str, ...]
+    legacy_columns: tuple[int | None, ...]
+    common_namespaces: bool
+    common_features: bool
+    per_namespace: bool
+    column_pos: dict[tuple[str, str], int] = field(repr=False, compare=False)
+    namespace_pos: dict[str, int] = field(repr=False, compare=False)
+    _groups: dict[tuple[int, int], PlanGroups] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def build(
+        cls,
+        strategy: "WeightedFeatureStrategy",
+        key: tuple,
+        namespaces: tuple[str, ...],
+        columns: tuple[tuple[str, str], ...],
+    ) -> "StrategyPlan":
+        namespace_pos = {namespace: pos for pos, namespace in enumerate(namespaces)}
+        column_pos = {column: pos for pos, column in enumerate(columns)}
+        namespace_columns: list[list[int]] = [[] for _ in namespaces]
+        for pos, (namespace, _) in enumerate(columns):
+            namespace_columns[namespace_pos[namespace]].append(pos)
+        feature_weights = tuple(strategy._feature_weight(namespace, name) for namespace, name in columns)
+        namespace_weights = tuple(strategy.namespace_weights.get(namespace, 1.0) for namespace in namespaces)
+        return cls(
+            key=key,
+            namespaces=namespaces,
+            columns=columns,
+            namespace_columns=tuple(tuple(items) for items in namespace_columns),
+            feature_weights=feature_weights,
+            namespace_weights=namespace_weights,
+            aggregate_weights=tuple(
+                weight * namespace_weights[namespace_pos[namespace]]
+                for weight, (namespace, _) in zip(feature_weights, columns)
+            ),
+            feature_keys=tuple(f"feature:{namespace}.{name}" for namespace, name in columns),
+            namespace_keys=tuple(f"namespace:{namespace}" for namespace in namespaces),
+            legacy_columns=tuple(column_pos.get(("core", name)) for name in LEGACY_FEATURES),
+            common_namespaces=strategy.namespace_presence_mode == "common",
+            common_features=strategy.feature_presence_mode == "common",
+            per_namespace=strategy.feature_namespace_mode == "per_namespace",
+            column_pos=column_pos,
+            namespace_pos=namespace_pos,
+        )
+
+    def pack(self, values: dict[str, dict[str, float]]) -> PackedRow:
+        """Pack normalized values into (namespace bits, column bits, dense values)."""
+        namespace_bits = 0
+        column_bits = 0
+        dense = [0.0] * len(self.columns)
+        for namespace, feature_values in values.items():
+            namespace_bits |= 1 << self.namespace_pos[namespace]
+            for feature_name, value in feature_values.items():
+                pos = self.column_pos[(namespace, feature_name)]
+                column_bits |= 1 << pos
+                dense[pos] = float(value)
+        return namespace_bits, column_bits, dense
+
+    def groups(
+        self,
+        source_namespaces: int,
+        target_namespaces: int,
+        source_columns: int,
+        target_columns: int,
+    ) -> PlanGroups:
+        """Selected ``(namespace pos, column positions)`` groups of a pair, in score order."""
+        if self.common_namespaces:
+            namespace_bits = source_namespaces & target_namespaces
+        else:
+            namespace_bits = source_namespaces | target_namespaces
+        if self.common_features:
+            column_bits = source_columns & target_columns
+        else:
+            column_bits = source_columns | target_columns
+        cached = self._groups.get((namespace_bits, column_bits))
+        if cached is not None:
+            return cached
+        groups = tuple(
+            (ns_pos, tuple(pos for pos in self.namespace_columns[ns_pos] if column_bits >> pos & 1))
+            for ns_pos in range(len(self.namespaces))
+            if namespace_bits >> ns_pos & 1
+        )
+        self._groups[(namespace_bits, column_bits)] = groups
+        return groups
@@ -8,7 +8,7 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any, Iterable
 
-from .features import FeatureTechnique
+from .features import FeatureTechnique, technique_concurrency
 
 
 def _is_technique(obj: Any) -> bool:
@@ -20,6 +20,11 @@ def _is_technique(obj: Any) -> bool:
     )
 
 
+def supports_calculate_many(technique: Any) -> bool:
+    """Whether a technique implements the batch ``calculate_many(cogs)`` method."""
+    return callable(getattr(technique, "calculate_many", None))
+
+
 def _as_techniques(value: Any) -> list[FeatureTechnique]:
     if isinstance(value, dict):
         items: Iterable[Any] = value.values()
@@ -37,6 +42,9 @@ def _as_techniques(value: Any) -> list[FeatureTechnique]:
             raise ValueError(
                 "Invalid feature technique object. Expected id/namespace/feature_name/calculate."
             )
+        if hasattr(obj, "calculate_many") and not supports_calculate_many(obj):
+            raise ValueError(f"Feature technique {obj.id} defines a non-callable calculate_many.")
+        technique_concurrency(obj)
         techniques.append(obj)
     return techniques
 
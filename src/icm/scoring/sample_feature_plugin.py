@@ -19,6 +19,9 @@ class ShapeUniqueLettersTechnique:
         letters = _letters_only(source)
         return float(len(set(letters)))
 
+    def calculate_with_profile(self, cog: Any, profile: Any) -> float:
+        return float(len(profile.unique))
+
 
 @dataclass
 class ShapeVowelRatioTechnique:
@@ -34,6 +37,11 @@ class ShapeVowelRatioTechnique:
         vowels = sum(1 for char in letters if char in {"a", "e", "i", "o", "u"})
         return float(vowels / len(letters))
 
+    def calculate_with_profile(self, cog: Any, profile: Any) -> float:
+        if not profile.letters:
+            return 0.0
+        return float(profile.vowel_count / len(profile.letters))
+
 
 def register_feature_techniques() -> list[object]:
     return [ShapeUniqueLettersTechnique(), ShapeVowelRatioTechnique()]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future, wait
+from typing import Any, Callable, Iterable
+
+from ..core.models import Cog
+from .features import FeatureTechnique, TextProfile, technique_concurrency
+from .plugins import supports_calculate_many
+
+Calculator = Callable[[FeatureTechnique, list[Cog]], list[float]]
+
+
+def checked_values(technique: FeatureTechnique, values: Iterable[Any], count: int) -> list[float]:
+    result = [float(value) for value in values]
+    if len(result) != count:
+        raise ValueError(f"Feature technique {technique.id} returned {len(result)} values for {count} cogs.")
+    return result
+
+
+def calculate_values(technique: FeatureTechnique, cogs: list[Cog]) -> list[float]:
+    """Compute one value per cog without any ``CogSystem`` state (used in worker processes)."""
+    if supports_calculate_many(technique):
+        return checked_values(technique, technique.calculate_many(cogs), len(cogs))  # type: ignore[attr-defined]
+    calculate_with_profile = getattr(technique, "calculate_with_profile", None)
+    if callable(calculate_with_profile):
+        return [float(calculate_with_profile(cog, TextProfile.of(cog))) for cog in cogs]
+    return [float(technique.calculate(cog)) for cog in cogs]
+
+
+def _calculate_chunk(payload: tuple[FeatureTechnique, list[Cog]]) -> list[float]:
+    technique, cogs = payload
+    return calculate_values(technique, cogs)
+
+
+class FeatureScheduler:
+    """Run feature techniques across cogs on thread and process pools.
+
+    Each technique is dispatched by its declared ``concurrency`` mode; a mode whose pool
+    is not configured falls back to the calling thread. Results come back per job in
+    submission order with chunks re-joined in cog order, so merging is deterministic.
+    If any job fails, pending work is cancelled, running work is awaited and the first
+    failure in job order is raised.
+    """
+
+    def __init__(
+        self,
+        thread_executor: Executor | None = None,
+        process_executor: Executor | None = None,
+        chunk_size: int = 64,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        self.thread_executor = thread_executor
+        self.process_executor = process_executor
+        self.chunk_size = chunk_size
+
+    def run(
+        self,
+        jobs: list[tuple[FeatureTechnique, list[Cog]]],
+        calculate: Calculator,
+    ) -> list[list[float]]:
+        """Return one value list per ``(technique, cogs)`` job.
+
+        ``calculate`` computes a job on this process (thread or inline), so it may use
+        caches shared with the caller; process jobs use ``calculate_values`` instead.
+        """
+        pending: list[list[Future] | None] = []
+        for technique, cogs in jobs:
+            mode = technique_concurrency(technique)
+            if mode == "process" and self.process_executor is not None:
+                pending.append(
+                    [
+                        self.process_executor.submit(_calculate_chunk, (technique, chunk))
+                        for chunk in self._chunks(cogs)
+                    ]
+                )
+            elif mode == "releases_gil" and self.thread_executor is not None:
+                pending.append(
+                    [self.thread_executor.submit(calculate, technique, chunk) for chunk in self._chunks(cogs)]
+                )
+            elif mode in ("thread_safe", "releases_gil") and self.thread_executor is not None:
+                pending.append([self.thread_executor.submit(calculate, technique, cogs)])
+            else:
+                pending.append(None)
+
+        results: list[list[float]] = []
+        try:
+            for (technique, cogs), futures in zip(jobs, pending):
+                if futures is None:
+                    results.append(calculate(technique, cogs))
+                else:
+                    results.append([value for future in futures for value in future.result()])
+        except BaseException:
+            outstanding = [future for futures in pending if futures is not None for future in futures]
+            for future in outstanding:
+                future.cancel()
+            wait(outstanding)
+            raise
+        return results
+
+    def _chunks(self, cogs: list[Cog]) -> list[list[Cog]]:
+        return [cogs[start : start + self.chunk_size] for start in range(0, len(cogs), self.chunk_size)] or [[]]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal, Protocol
+from typing import TYPE_CHECKING, Literal, Protocol
 
 from ..core.models import Cog, ScoreEntry
 
+if TYPE_CHECKING:
+    from ..core.feature_table import FeatureTable
+    from .plan import PackedRow, StrategyPlan
+
 
 class SimilarityStrategy(Protocol):
     id: str
@@ -72,6 +76,7 @@ class WeightedFeatureStrategy:
     feature_weights: dict[str, float] = field(default_factory=dict)
     directional_bias_feature: str = "directional_bias"
     extra_feature_weights: dict[str, float] = field(default_factory=dict)
+    _plan: "StrategyPlan | None" = field(default=None, init=False, repr=False, compare=False)
 
     def score(self, source: Cog, target: Cog) -> ScoreEntry:
         theme_score = 1.0 if source.theme == target.theme else 0.0
@@ -110,7 +115,219 @@ class WeightedFeatureStrategy:
             feature_score = _weighted_average(namespace_scores)
         else:
             feature_score = _weighted_average(aggregate_pairs)
+        base_score, variance = self._symmetric_terms(
+            source, target, theme_score, feature_score, vector, feature_similarities
+        )
+        return self._directed(source, target, base_score, vector, variance)
+
+    def score_matrix(
+        self,
+        sources: list[Cog],
+        targets: list[Cog] | None = None,
+        feature_table: "FeatureTable | None" = None,
+        include_vectors: bool = True,
+    ) -> list[ScoreEntry]:
+        """Score all ordered (source, target) pairs with distinct ids, row-major.
+
+        Uses the NumPy engine in ``matrix.py`` when available and otherwise scores each
+        pair against a compiled ``StrategyPlan``; both match ``score`` bit for bit.
+        A ``feature_table`` holding every cog lets the engine read columns directly;
+        ``include_vectors=False`` returns entries with empty explanation vectors.
+        Scoring a population against itself evaluates each unordered pair once.
+        """
+        from .matrix import numpy_available, weighted_score_matrix
+
+        targets = sources if targets is None else targets
+        if numpy_available():
+            return weighted_score_matrix(
+                self,
+                sources,
+                targets,
+                feature_table=feature_table,
+                include_vectors=include_vectors,
+            )
+        forward, _ = self._score_planned_pairs(sources, targets, include_vectors, reverse=False)
+        return forward
+
+    def score_rows(
+        self,
+        sources: list[Cog],
+        targets_by_source: list[list[Cog]],
+        feature_table: "FeatureTable | None" = None,
+        include_vectors: bool = True,
+    ) -> list[ScoreEntry]:
+        """Score each source against its own target list (e.g. candidates), row-major.
+
+        The NumPy engine evaluates only the listed pairs in one gathered pass; without
+        it each row is scored against a compiled plan. Same-id pairs are skipped.
+        """
+        from .matrix import numpy_available, weighted_score_rows
+
+        if numpy_available():
+            return weighted_score_rows(
+                self,
+                sources,
+                targets_by_source,
+                feature_table=feature_table,
+                include_vectors=include_vectors,
+            )
+        return [
+            entry
+            for source, targets in zip(sources, targets_by_source)
+            for entry in self._score_planned_pairs([source], targets, include_vectors, reverse=False)[0]
+        ]
+
+    def score_both_ways(
+        self,
+        sources: list[Cog],
+        targets: list[Cog],
+        feature_table: "FeatureTable | None" = None,
+        include_vectors: bool = True,
+    ) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+        """Score sources x targets and targets x sources, sharing each pair's symmetric core.
+
+        Everything except ``directional_adjustment`` (theme match, similarities, namespace
+        averages, extras and variance) is symmetric in source and target, so each pair is
+        evaluated once and only the directional term is applied per direction. Returns the
+        forward entries row-major over ``sources`` and the reverse ones row-major over
+        ``targets``, skipping same-id pairs.
+        """
+        from .matrix import numpy_available, weighted_score_both_ways
+
+        if numpy_available():
+            return weighted_score_both_ways(
+                self,
+                sources,
+                targets,
+                feature_table=feature_table,
+                include_vectors=include_vectors,
+            )
+        if targets is sources:
+            forward = self.score_matrix(sources, include_vectors=include_vectors)
+            return forward, list(forward)
+        return self._score_planned_pairs(sources, targets, include_vectors, reverse=True)
+
+    def compile(self, namespaces: list[str], columns: list[tuple[str, str]]) -> "StrategyPlan":
+        """Return the plan for a sorted feature schema, rebuilding it only on change.
+
+        The cached plan is keyed by the strategy configuration and the schema, so
+        editing weights or modes in place, or scoring cogs with new features or
+        namespaces, compiles a fresh plan.
+        """
+        from .plan import StrategyPlan
+
+        key = (self._config_key(), tuple(namespaces), tuple(columns))
+        plan = self._plan
+        if plan is None or plan.key != key:
+            plan = StrategyPlan.build(self, key, key[1], key[2])
+            self._plan = plan
+        return plan
+
+    def _score_planned_pairs(
+        self,
+        sources: list[Cog],
+        targets: list[Cog],
+        include_vectors: bool,
+        reverse: bool,
+    ) -> tuple[list[ScoreEntry], list[ScoreEntry]]:
+        if not sources or not targets:
+            return [], []
+        symmetric = targets is sources
+        source_values = [_normalize_namespaced_values(cog) for cog in sources]
+        target_values = source_values if symmetric else [_normalize_namespaced_values(cog) for cog in targets]
+        groups = (source_values, target_values)
+        namespaces = sorted({namespace for group in groups for values in group for namespace in values})
+        columns = sorted(
+            {
+                (namespace, feature_name)
+                for group in groups
+                for values in group
+                for namespace, feature_values in values.items()
+                for feature_name in feature_values
+            }
+        )
+        plan = self.compile(namespaces, columns)
+        source_rows = [plan.pack(values) for values in source_values]
+        target_rows = source_rows if symmetric else [plan.pack(values) for values in target_values]
+
+        forward_rows: list[list[ScoreEntry]] = [[] for _ in sources]
+        if symmetric:
+            reverse_rows: list[list[ScoreEntry]] | None = forward_rows
+        else:
+            reverse_rows = [[] for _ in targets] if reverse else None
+        for source_pos, source in enumerate(sources):
+            first = source_pos + 1 if symmetric else 0
+            for target_pos in range(first, len(targets)):
+                target = targets[target_pos]
+                if target.id == source.id:
+                    continue
+                base_score, vector, variance = self._planned_core(
+                    plan, source, target, source_rows[source_pos], target_rows[target_pos]
+                )
+                if reverse_rows is not None:
+                    reverse_rows[target_pos].append(
+                        self._directed(
+                            target, source, base_score, dict(vector) if include_vectors else None, variance
+                        )
+                    )
+                forward_rows[source_pos].append(
+                    self._directed(source, target, base_score, vector if include_vectors else None, variance)
+                )
+
+        forward = [entry for row in forward_rows for entry in row]
+        if reverse_rows is None or symmetric:
+            return forward, []
+        return forward, [entry for row in reverse_rows for entry in row]
+
+    def _planned_core(
+        self,
+        plan: "StrategyPlan",
+        source: Cog,
+        target: Cog,
+        source_row: "PackedRow",
+        target_row: "PackedRow",
+    ) -> tuple[float, dict[str, float], float]:
+        source_namespaces, source_columns, source_values = source_row
+        target_namespaces, target_columns, target_values = target_row
+        theme_score = 1.0 if source.theme == target.theme else 0.0
+        vector: dict[str, float] = {"theme_match": theme_score}
+        namespace_scores: list[tuple[float, float]] = []
+        aggregate_pairs: list[tuple[float, float]] = []
+        feature_similarities: list[float] = []
+        feature_keys = plan.feature_keys
+        feature_weights = plan.feature_weights
+        aggregate_weights = plan.aggregate_weights
+
+        for ns_pos, positions in plan.groups(source_namespaces, target_namespaces, source_columns, target_columns):
+            feature_pairs: list[tuple[float, float]] = []
+            for pos in positions:
+                similarity = _relative_similarity(source_values[pos], target_values[pos])
+                vector[feature_keys[pos]] = similarity
+                feature_similarities.append(similarity)
+                feature_pairs.append((similarity, feature_weights[pos]))
+                aggregate_pairs.append((similarity, aggregate_weights[pos]))
+            namespace_score = _weighted_average(feature_pairs)
+            vector[plan.namespace_keys[ns_pos]] = namespace_score
+            namespace_scores.append((namespace_score, plan.namespace_weights[ns_pos]))
+
+        if plan.per_namespace:
+            feature_score = _weighted_average(namespace_scores)
+        else:
+            feature_score = _weighted_average(aggregate_pairs)
+        base_score, variance = self._symmetric_terms(
+            source, target, theme_score, feature_score, vector, feature_similarities
+        )
+        return base_score, vector, variance
 
+    def _symmetric_terms(
+        self,
+        source: Cog,
+        target: Cog,
+        theme_score: float,
+        feature_score: float,
+        vector: dict[str, float],
+        feature_similarities: list[float],
+    ) -> tuple[float, float]:
         # Legacy explicit core weights remain available for core comparisons.
         core_breadth = vector.get("feature:core.breadth", _relative_similarity(source.breadth, target.breadth))
         core_depth = vector.get("feature:core.depth", _relative_similarity(source.depth, target.depth))
@@ -137,25 +354,48 @@ class WeightedFeatureStrategy:
         if total_extra_weight > 0:
             base_score = (base_score + weighted_extra) / (1.0 + total_extra_weight)
 
-        source_bias = source.features.get(self.directional_bias_feature, 0.0)
-        target_bias = target.features.get(self.directional_bias_feature, 0.0)
-        directional_adjustment = (source_bias - target_bias) * 0.05
-        vector["directional_adjustment"] = directional_adjustment
-
-        final_score = _clamp_01(base_score + directional_adjustment)
         variance = 0.0
         if feature_similarities:
             variance = max(feature_similarities) - min(feature_similarities)
+        return base_score, variance
+
+    def _directed(
+        self,
+        source: Cog,
+        target: Cog,
+        base_score: float,
+        vector: dict[str, float] | None,
+        variance: float,
+    ) -> ScoreEntry:
+        """Apply the directional term; ``vector=None`` yields an entry without a vector."""
+        source_bias = source.features.get(self.directional_bias_feature, 0.0)
+        target_bias = target.features.get(self.directional_bias_feature, 0.0)
+        directional_adjustment = (source_bias - target_bias) * 0.05
+        if vector is not None:
+            vector["directional_adjustment"] = directional_adjustment
 
         return ScoreEntry(
             from_cog_id=source.id,
             to_cog_id=target.id,
-            score=final_score,
-            vector=vector,
+            score=_clamp_01(base_score + directional_adjustment),
+            vector=vector if vector is not None else {},
             variance=variance,
             strategy_id=self.id,
         )
 
+    def _config_key(self) -> tuple:
+        return (
+            self.theme_weight,
+            self.breadth_weight,
+            self.depth_weight,
+            self.volume_weight,
+            self.feature_namespace_mode,
+            self.namespace_presence_mode,
+            self.feature_presence_mode,
+            tuple(self.namespace_weights.items()),
+            tuple(self.feature_weights.items()),
+        )
+
     def _selected_namespaces(
         self,
         source_values: dict[str, dict[str, float]],